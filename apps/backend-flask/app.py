@@ -5,7 +5,7 @@ from __future__ import annotations
 import os
 from logging.config import dictConfig
 
-from flask import Flask
+from flask import Flask, Response
 from flask_cors import CORS
 
 from auth import bp as auth_blueprint
@@ -18,6 +18,12 @@ from system import bp as system_blueprint
 from table import bp as table_blueprint
 from upload import bp as upload_blueprint
 from user import bp as user_blueprint
+from utils.json_provider import OrjsonProvider
+
+# Liveness probes hit /api/healthz constantly; the body never changes, so it is
+# encoded once. A fresh Response is still built per request because after-request
+# hooks (flask-cors) mutate response headers.
+_HEALTHZ_BODY = b'{"status":"ok"}\n'
 
 
 def _configure_logging() -> None:
@@ -77,10 +83,14 @@ def create_app() -> Flask:
     _configure_logging()
 
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
 
     # 配置文件上传大小限制（例如 100MB）
     app.config['MAX_CONTENT_LENGTH'] = 100 * 1024 * 1024
 
+    # 前置 nginx/Apache 时可让其直接发送磁盘上的下载文件（X-Sendfile）
+    app.config['USE_X_SENDFILE'] = os.environ.get("FLASK_BACKEND_X_SENDFILE") == "1"
+
     # 启用 CORS
     CORS(app, resources={
         r"/api/*": {
@@ -104,7 +114,7 @@ def create_app() -> Flask:
 
     @app.get("/api/healthz")
     def healthcheck():
-        return {"status": "ok"}
+        return Response(_HEALTHZ_BODY, mimetype="application/json")
 
     return app
 
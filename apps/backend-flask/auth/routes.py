@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
 from typing import Optional
 
-from flask import Blueprint, make_response, request
+from flask import Blueprint, Response, jsonify, request
 
 from utils import cookies
 from utils.auth import (
@@ -15,6 +14,7 @@ from utils.auth import (
     verify_refresh_token,
 )
 from utils.data import MOCK_CODES, MOCK_USERS
+from utils.payloads import read_json_body
 from utils.responses import (
     error_response,
     forbidden,
@@ -24,30 +24,32 @@ from utils.responses import (
 
 bp = Blueprint("auth", __name__, url_prefix="/api/auth")
 
+_USERS_BY_NAME = {user["username"]: user for user in MOCK_USERS}
+_CODES_BY_NAME = {item["username"]: item["codes"] for item in MOCK_CODES}
+
 
 def _find_user(username: str, password: Optional[str] = None):
-    for user in MOCK_USERS:
-        if user["username"] != username:
-            continue
-        if password is not None and user.get("password") != password:
-            continue
-        return user
-    return None
+    user = _USERS_BY_NAME.get(username)
+    if user is None:
+        return None
+    if password is not None and user.get("password") != password:
+        return None
+    return user
 
 
 @bp.post("/login")
 def login():
-    payload = request.get_json(silent=True) or {}
+    payload = read_json_body(request) or {}
     username = payload.get("username")
     password = payload.get("password")
 
     if not username or not password:
-        response = make_response(
+        response = jsonify(
             error_response(
                 "BadRequestException", "Username and password are required"
-            ),
-            400,
+            )
         )
+        response.status_code = 400
         cookies.clear_refresh_token_cookie(response)
         return response
 
@@ -60,10 +62,9 @@ def login():
     access_token = generate_access_token(user)
     refresh_token = generate_refresh_token(user)
 
-    user_payload = deepcopy(user)
-    user_payload["accessToken"] = access_token
+    user_payload = {**user, "accessToken": access_token}
 
-    response = make_response(success_response(user_payload))
+    response = jsonify(success_response(user_payload))
     cookies.set_refresh_token_cookie(response, refresh_token)
     return response
 
@@ -82,15 +83,17 @@ def refresh():
     if not user:
         return forbidden()
 
+    # Rotate the refresh token rather than echoing back the cookie the client
+    # already holds; re-setting it still slides the cookie expiry forward.
     access_token = generate_access_token(user)
-    response = make_response(access_token)
-    cookies.set_refresh_token_cookie(response, refresh_token)
+    response = Response(access_token)
+    cookies.set_refresh_token_cookie(response, generate_refresh_token(user))
     return response
 
 
 @bp.post("/logout")
 def logout():
-    response = make_response(success_response(""))
+    response = jsonify(success_response(""))
     cookies.clear_refresh_token_cookie(response)
     return response
 
@@ -101,10 +104,4 @@ def codes():
     if not user:
         return unauthorized()
 
-    codes = []
-    for item in MOCK_CODES:
-        if item["username"] == user["username"]:
-            codes = item["codes"]
-            break
-
-    return success_response(codes)
+    return success_response(_CODES_BY_NAME.get(user["username"], []))
@@ -2,45 +2,29 @@
 
 from __future__ import annotations
 
+import os
+import stat
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 
-from flask import Blueprint
+from flask import Blueprint, make_response, request
 
 from utils.responses import success_response
 
 bp = Blueprint("custom", __name__, url_prefix="/api/custom")
 
+_FUZZ_TEXT_CANDIDATES: Tuple[Path, ...] = (
+    # From the SNMP fuzzer logs directory (primary location)
+    Path(__file__).parent.parent / "protocol_compliance" / "snmpfuzzer_logs" / "fuzz_output.txt",
+    # From the mock backend location (fallback)
+    Path(__file__).parent.parent.parent / "backend-mock" / "api" / "custom" / "fuzz_output.txt",
+    # From current directory
+    Path("fuzz_output.txt"),
+    # From custom directory
+    Path(__file__).parent / "fuzz_output.txt",
+)
 
-@bp.get("/text")
-def get_fuzz_text():
-    """Get fuzz testing text data."""
-    # Try to find the fuzz_output.txt file from SNMP fuzzer logs
-    candidates = [
-        # From the SNMP fuzzer logs directory (primary location)
-        Path(__file__).parent.parent / "protocol_compliance" / "snmpfuzzer_logs" / "fuzz_output.txt",
-        # From the mock backend location (fallback)
-        Path(__file__).parent.parent.parent / "backend-mock" / "api" / "custom" / "fuzz_output.txt",
-        # From current directory
-        Path("fuzz_output.txt"),
-        # From custom directory
-        Path(__file__).parent / "fuzz_output.txt",
-    ]
-    
-    text_content = ""
-    for candidate in candidates:
-        if candidate.exists() and candidate.is_file():
-            try:
-                with open(candidate, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    if content and content.strip():
-                        text_content = content
-                        break
-            except Exception:
-                continue
-    
-    # If no file found, return default fuzz data
-    if not text_content:
-        text_content = """[1] 版本=v1, 类型=get
+_DEFAULT_FUZZ_TEXT = """[1] 版本=v1, 类型=get
 选择OIDs=['1.3.6.1.2.1.1.1.0']
 报文HEX: 302902010004067075626C6963A01C02040E8F83C502010002010030
 [发送尝试] 长度=43 字节
@@ -70,5 +54,44 @@ def get_fuzz_text():
 总耗时: 7.2 秒
 发送总数据包: 5
 平均发送速率: 0.69 包/秒"""
-    
-    return success_response({"text": text_content})
+
+# path -> ((st_mtime_ns, st_size), content); a file is only re-read when its stat changes.
+_fuzz_text_cache: Dict[Path, Tuple[Tuple[int, int], str]] = {}
+
+
+def _read_candidate(candidate: Path) -> Optional[str]:
+    try:
+        stat_result = os.stat(candidate)
+    except OSError:
+        return None
+    if not stat.S_ISREG(stat_result.st_mode):
+        return None
+
+    signature = (stat_result.st_mtime_ns, stat_result.st_size)
+    cached = _fuzz_text_cache.get(candidate)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    try:
+        with open(candidate, "r", encoding="utf-8") as f:
+            content = f.read()
+    except Exception:
+        return None
+    _fuzz_text_cache[candidate] = (signature, content)
+    return content
+
+
+def _load_fuzz_text() -> str:
+    for candidate in _FUZZ_TEXT_CANDIDATES:
+        content = _read_candidate(candidate)
+        if content and content.strip():
+            return content
+    return _DEFAULT_FUZZ_TEXT
+
+
+@bp.get("/text")
+def get_fuzz_text():
+    """Get fuzz testing text data."""
+    response = make_response(success_response({"text": _load_fuzz_text()}))
+    response.add_etag()
+    return response.make_conditional(request)
@@ -2,21 +2,16 @@
 
 from __future__ import annotations
 
-from flask import Blueprint, make_response, request
+import hashlib
+
+from flask import Blueprint, Response, request
 
 from utils.auth import verify_access_token
 from utils.responses import unauthorized
 
 bp = Blueprint("demo", __name__, url_prefix="/api/demo")
 
-
-@bp.get("/bigint")
-def bigint():
-    user = verify_access_token(request.headers.get("Authorization"))
-    if not user:
-        return unauthorized()
-
-    data = """
+_BIGINT_BODY = """
   {
     "code": 0,
     "message": "success",
@@ -35,7 +30,16 @@ def bigint():
                 }
             ]
   }
-  """
-    response = make_response(data)
-    response.headers["Content-Type"] = "application/json"
-    return response
+  """.encode("utf-8")
+_BIGINT_ETAG = hashlib.sha1(_BIGINT_BODY).hexdigest()
+
+
+@bp.get("/bigint")
+def bigint():
+    user = verify_access_token(request.headers.get("Authorization"))
+    if not user:
+        return unauthorized()
+
+    response = Response(_BIGINT_BODY, content_type="application/json")
+    response.set_etag(_BIGINT_ETAG)
+    return response.make_conditional(request)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
+from typing import Any, Dict, List
 
 from flask import Blueprint, request
 
@@ -12,6 +12,11 @@ from utils.responses import success_response, unauthorized
 
 bp = Blueprint("menu", __name__, url_prefix="/api/menu")
 
+# Served as-is without copying; response data built from it must not be mutated.
+_MENUS_BY_USERNAME: Dict[str, List[Dict[str, Any]]] = {
+    item["username"]: item["menus"] for item in MOCK_MENUS
+}
+
 
 @bp.get("/all")
 def menu_all():
@@ -19,9 +24,4 @@ def menu_all():
     if not user:
         return unauthorized()
 
-    menus = []
-    for item in MOCK_MENUS:
-        if item["username"] == user["username"]:
-            menus = deepcopy(item["menus"])
-            break
-    return success_response(menus)
+    return success_response(_MENUS_BY_USERNAME.get(user["username"], []))
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import os
+import re
 import shlex
 import tempfile
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple
+from types import MappingProxyType
+from typing import Mapping, Optional, Sequence, Tuple
 
 __all__ = [
     "ArtifactLayout",
@@ -21,11 +24,18 @@ __all__ = [
 ]
 
 
+_DEFAULT_ANALYSIS_COMMAND: Tuple[str, ...] = ("static",)
+_TRUE_LITERALS = frozenset({"1", "true", "yes", "on"})
+_WHITESPACE_RE = re.compile(r"\s")
+
+
 def _env_bool(name: str, default: bool = False) -> bool:
     raw = os.environ.get(name)
     if raw is None:
         return default
-    return raw.strip().lower() in {"1", "true", "yes", "on"}
+    if raw in ("1", "0"):
+        return raw == "1"
+    return raw.strip().lower() in _TRUE_LITERALS
 
 
 def _env_int(name: str, default: Optional[int] = None) -> Optional[int]:
@@ -42,23 +52,32 @@ def _split_env_list(name: str, default: Sequence[str] = ()) -> Tuple[str, ...]:
     raw = os.environ.get(name)
     if not raw:
         return tuple(default)
-    items = [item.strip() for item in raw.split(",")]
-    return tuple(item for item in items if item)
+    if _WHITESPACE_RE.search(raw) is None:
+        # Nothing to strip, so the split items can be kept as-is.
+        return tuple(filter(None, raw.split(",")))
+    return tuple(filter(None, [item.strip() for item in raw.split(",")]))
 
 
 def _default_runtime_root() -> Path:
     base = os.environ.get("PG_RUNTIME_ROOT")
     if base:
-        return Path(base).expanduser().resolve()
+        # abspath is pure string work; consumers that need symlinks resolved
+        # (per-job paths, cleanup roots) already call resolve() themselves.
+        return Path(os.path.abspath(os.path.expanduser(base)))
     return Path(tempfile.gettempdir()) / "protocolguard"
 
 
+@lru_cache(maxsize=32)
+def _split_command(raw: str) -> Tuple[str, ...]:
+    return tuple(shlex.split(raw))
+
+
 def _ensure_directory(path: Path) -> Path:
     path.mkdir(parents=True, exist_ok=True)
     return path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ArtifactLayout:
     """Relative paths inside the workspace for expected ProtocolGuard artefacts."""
 
@@ -80,21 +99,24 @@ class ArtifactLayout:
                 return default
             return Path(value)
 
+        # With slots=True the class attributes are slot descriptors, so read the
+        # field defaults from a default instance instead.
+        defaults = cls()
         return cls(
-            bitcode=pick("PG_ARTIFACT_BITCODE", cls.bitcode),
-            build_log=pick("PG_ARTIFACT_BUILD_LOG", cls.build_log),
-            wpa_report=pick("PG_ARTIFACT_WPA_REPORT", cls.wpa_report),
-            packet_callgraph=pick("PG_ARTIFACT_PACKET_REPORT", cls.packet_callgraph),
-            function_summary=pick("PG_ARTIFACT_FUNCTION_SUMMARY", cls.function_summary),
-            database=pick("PG_ARTIFACT_DATABASE_DIR", cls.database),
-            rule_config=pick("PG_ARTIFACT_RULE_CONFIG", cls.rule_config),
-            original_ir=pick("PG_ARTIFACT_ORIGINAL_IR", cls.original_ir),
-            binary_path=pick("PG_ARTIFACT_BINARY_PATH", cls.binary_path),
+            bitcode=pick("PG_ARTIFACT_BITCODE", defaults.bitcode),
+            build_log=pick("PG_ARTIFACT_BUILD_LOG", defaults.build_log),
+            wpa_report=pick("PG_ARTIFACT_WPA_REPORT", defaults.wpa_report),
+            packet_callgraph=pick("PG_ARTIFACT_PACKET_REPORT", defaults.packet_callgraph),
+            function_summary=pick("PG_ARTIFACT_FUNCTION_SUMMARY", defaults.function_summary),
+            database=pick("PG_ARTIFACT_DATABASE_DIR", defaults.database),
+            rule_config=pick("PG_ARTIFACT_RULE_CONFIG", defaults.rule_config),
+            original_ir=pick("PG_ARTIFACT_ORIGINAL_IR", defaults.original_ir),
+            binary_path=pick("PG_ARTIFACT_BINARY_PATH", defaults.binary_path),
         )
 
 
-DEFAULT_CONFIG_PACKET_TYPES: Dict[str, List[str]] = {
-    "mqtt_packet_type": [
+DEFAULT_CONFIG_PACKET_TYPES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "mqtt_packet_type": (
         "CONNECT",
         "CONNACK",
         "PUBLISH",
@@ -110,8 +132,8 @@ DEFAULT_CONFIG_PACKET_TYPES: Dict[str, List[str]] = {
         "PINGRESP",
         "DISCONNECT",
         "AUTH",
-    ],
-    "dhcpv6_packet_type": [
+    ),
+    "dhcpv6_packet_type": (
         "DHCP6_SOLICIT",
         "DHCP6_ADVERTISE",
         "DHCP6_REQUEST",
@@ -125,14 +147,14 @@ DEFAULT_CONFIG_PACKET_TYPES: Dict[str, List[str]] = {
         "DHCP6_RECONFIGURE",
         "DHCP6_RELAYFORW",
         "DHCP6_RELAYREPL",
-    ],
-    "coap_packet_type": [
+    ),
+    "coap_packet_type": (
         "CONFIRMABLE",
         "NON_CONFIRMABLE",
         "ACKNOWLEDGEMENT",
         "RESET",
-    ],
-    "ftp_packet_type": [
+    ),
+    "ftp_packet_type": (
         "USER",
         "PASS",
         "ACCT",
@@ -177,8 +199,8 @@ DEFAULT_CONFIG_PACKET_TYPES: Dict[str, List[str]] = {
         "MIC",
         "PBSZ",
         "PROT",
-    ],
-    "tls13_message_type": [
+    ),
+    "tls13_message_type": (
         "CLIENT_HELLO",
         "SERVER_HELLO",
         "NEW_SESSION_TICKET",
@@ -190,11 +212,11 @@ DEFAULT_CONFIG_PACKET_TYPES: Dict[str, List[str]] = {
         "FINISHED",
         "KEY_UPDATE",
         "HELLO_RETRY_REQUEST",
-    ],
-}
+    ),
+})
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProtocolGuardDockerSettings:
     """Runtime configuration for the Docker integration."""
 
@@ -234,15 +256,20 @@ class ProtocolGuardDockerSettings:
         analysis_image = os.environ.get("PG_ANALYSIS_IMAGE", "protocolguard:latest")
         builder_image = os.environ.get("PG_BUILDER_IMAGE") or None
 
-        def parse_command(env_name: str, default: str) -> Tuple[str, ...]:
+        def parse_command(env_name: str, default: Tuple[str, ...]) -> Tuple[str, ...]:
             raw = os.environ.get(env_name)
             if raw:
-                return tuple(shlex.split(raw))
-            return tuple(shlex.split(default))
+                return _split_command(raw)
+            return default
 
-        analysis_command = parse_command("PG_ANALYSIS_COMMAND", "static")
+        analysis_command = parse_command("PG_ANALYSIS_COMMAND", _DEFAULT_ANALYSIS_COMMAND)
         builder_command_env = os.environ.get("PG_BUILDER_COMMAND")
-        builder_command = tuple(shlex.split(builder_command_env)) if builder_command_env else None
+        # Blank values mean "use the image default", same as leaving the variable unset.
+        builder_command = (
+            _split_command(builder_command_env)
+            if builder_command_env and builder_command_env.strip()
+            else None
+        )
 
         runtime_root = _default_runtime_root()
         workspace_root = Path(os.environ.get("PG_WORKSPACE_ROOT", runtime_root / "workspaces")).expanduser()
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Optional, Sequence
 
 __all__ = [
     "ProtocolGuardDockerError",
@@ -26,13 +26,13 @@ class ProtocolGuardExecutionError(ProtocolGuardDockerError):
         self,
         message: str,
         *,
-        logs: Optional[List[str]] = None,
+        logs: Optional[Sequence[str]] = None,
         log_excerpt: Optional[str] = None,
         image: Optional[str] = None,
         status: Optional[int] = None,
     ) -> None:
         super().__init__(message)
-        self.logs = logs or []
+        self.logs: Sequence[str] = logs or ()
         self.log_excerpt = log_excerpt
         self.image = image
         self.status = status
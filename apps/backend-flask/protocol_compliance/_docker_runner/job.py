@@ -8,7 +8,7 @@ from pathlib import Path
 __all__ = ["JobPaths"]
 
 
-@dataclass
+@dataclass(slots=True)
 class JobPaths:
     job_id: str
     workspace: Path
@@ -486,15 +486,21 @@ class ProtocolGuardDockerRunner:
     def _ensure_workspace_structure(self, job_paths: JobPaths) -> None:
         workspace = job_paths.workspace
         artifacts = self._settings.artifacts
-        for relative in (
-            artifacts.bitcode,
-            artifacts.build_log,
-            artifacts.wpa_report,
-            artifacts.packet_callgraph,
-            artifacts.function_summary,
-            artifacts.rule_config,
-        ):
-            (workspace / relative).parent.mkdir(parents=True, exist_ok=True)
+        # Most artefacts sit directly in the workspace, so create each distinct
+        # parent once instead of once per artefact.
+        parents = {
+            relative.parent
+            for relative in (
+                artifacts.bitcode,
+                artifacts.build_log,
+                artifacts.wpa_report,
+                artifacts.packet_callgraph,
+                artifacts.function_summary,
+                artifacts.rule_config,
+            )
+        }
+        for parent in parents:
+            (workspace / parent).mkdir(parents=True, exist_ok=True)
         database_dir = workspace / artifacts.database
         database_dir.mkdir(parents=True, exist_ok=True)
 
@@ -3,14 +3,16 @@
 from __future__ import annotations
 
 import contextlib
-import io
+import os
 import re
+import tempfile
 import uuid
 from datetime import datetime, timezone
 from typing import Any, Callable, Dict
 
 from flask import make_response, request, send_file
 
+from utils.payloads import read_json_body
 from utils.responses import error_response, success_response
 
 from .aflnet import (
@@ -21,6 +23,9 @@ from .aflnet import (
     _write_aflnet_poc_archive,
 )
 
+# Findings bundles up to this size stay in memory; larger ones spill to disk.
+ARCHIVE_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
 
 def create_aflnet_handlers(
     ensure_authenticated: Callable[[], tuple[object, object]],
@@ -46,29 +51,42 @@ def create_aflnet_handlers(
                 404,
             )
 
-        buffer = io.BytesIO()
-        added = _write_aflnet_poc_archive(
-            buffer,
-            artifact_id=None,
-            crash_log_path=crash_log_path,
-            implementation=implementation,
-            output_root=output_root,
-            protocol=protocol,
+        # Not a context manager: send_file takes ownership of the spool and closes
+        # it after the response; the error paths below close it themselves.
+        buffer = tempfile.SpooledTemporaryFile(  # noqa: SIM115 - closed by send_file
+            max_size=ARCHIVE_SPOOL_MAX_BYTES
         )
+        try:
+            added = _write_aflnet_poc_archive(
+                buffer,
+                artifact_id=None,
+                crash_log_path=crash_log_path,
+                implementation=implementation,
+                output_root=output_root,
+                protocol=protocol,
+            )
+        except BaseException:
+            buffer.close()
+            raise
 
         if added <= 1:
+            buffer.close()
             return make_response(error_response("AFLNET 输出目录中没有可打包的 findings 文件"), 404)
 
+        # send_file only sizes BytesIO objects and real paths; set the length here.
+        size = buffer.seek(0, os.SEEK_END)
         buffer.seek(0)
         timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
         safe_impl = re.sub(r"[^A-Za-z0-9_.-]+", "-", implementation).strip("-") or "aflnet"
-        return send_file(
+        response = send_file(
             buffer,
             mimetype="application/zip",
             as_attachment=True,
             download_name=f"{safe_impl}-aflnet-findings-{timestamp}.zip",
             max_age=0,
         )
+        response.content_length = size
+        return response
 
     def snapshot_aflnet_result():
         """Persist the current AFLNET findings bundle for history downloads."""
@@ -76,7 +94,7 @@ def create_aflnet_handlers(
         if error:
             return error
 
-        data = request.get_json(silent=True) or {}
+        data = read_json_body(request) or {}
         protocol = data.get("protocol") or "MQTT"
         implementation = data.get("implementation") or "SOL"
         crash_log_path = data.get("crashLogPath")
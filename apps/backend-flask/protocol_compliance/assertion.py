@@ -468,8 +468,8 @@ def run_assert_generation(
                 progress_callback(job_identifier, "instrumentation", "Launching instrumentation container")
 
             instr_details = _run_instrumentation_container(
-                image=_docker_settings().analysis_image,
-                network=_docker_settings().network,
+                image=settings.analysis_image,
+                network=settings.network,
                 workspace=workspace_dir,
                 output=output_dir,
                 extra_args=(["--limit", str(limit_env)] if (limit_env := os.environ.get("PG_INSTRUMENTATION_LIMIT")) else None),
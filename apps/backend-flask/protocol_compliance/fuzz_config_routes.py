@@ -16,6 +16,7 @@ from typing import Any, Callable, Dict, Optional, cast
 
 from flask import make_response, request
 
+from utils.payloads import read_json_body
 from utils.responses import error_response, success_response
 
 from .assertion import get_assert_generation_job, get_assert_generation_result
@@ -128,7 +129,7 @@ def create_fuzz_config_handlers(
         if error:
             return error
 
-        data = request.get_json(silent=True) or {}
+        data = read_json_body(request) or {}
         assert_generation_job_id = str(data.get("assertGenerationJobId") or "").strip()
         instrumented_zip: Optional[Path] = None
         if assert_generation_job_id:
@@ -222,17 +223,21 @@ def create_fuzz_config_handlers(
         log_file = _job_log_file(snapshot)
         content = ""
         position = from_position
-        if log_file.exists():
+        file_size = 0
+        try:
             with log_file.open("r", encoding="utf-8", errors="replace") as handle:
                 handle.seek(from_position)
                 content = handle.read()
                 position = handle.tell()
+                file_size = os.fstat(handle.fileno()).st_size
+        except FileNotFoundError:
+            pass
         return make_response(
             success_response(
                 {
                     "content": content,
                     "position": position,
-                    "fileSize": log_file.stat().st_size if log_file.exists() else 0,
+                    "fileSize": file_size,
                     "job": FUZZ_CONFIG_JOBS.snapshot(job_id) or snapshot,
                     "logFilePath": str(log_file),
                 }
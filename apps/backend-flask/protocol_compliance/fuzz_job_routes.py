@@ -6,7 +6,9 @@ import logging
 import json
 import os
 import shutil
+import stat
 import subprocess
+import time
 import uuid
 import zipfile
 from datetime import datetime, timezone
@@ -15,6 +17,7 @@ from typing import Any, Callable, Dict, Optional, cast
 
 from flask import make_response, request
 
+from utils.payloads import read_json_body
 from utils.responses import error_response, success_response
 
 from .assertion import get_assert_generation_job, get_assert_generation_result
@@ -25,6 +28,9 @@ DEBUG_REPLAY_INSTRUMENTED_CODE_ZIP_RELATIVE_PATH = Path(
     "replay/fuzz-startup-failed-after-instrumentation/latest/"
     "assertion-output/instrumented_code.zip"
 )
+# Status and log polling both probe the container; reuse a recent "running" answer.
+CONTAINER_RUNNING_CACHE_TTL_SECONDS = 2.0
+_container_running_checked_at: Dict[str, float] = {}
 
 
 class FuzzJobRegistry:
@@ -100,7 +106,7 @@ def create_fuzz_job_handlers(
         if error:
             return error
 
-        data = request.get_json(silent=True) or {}
+        data = read_json_body(request) or {}
         assert_generation_job_id = str(data.get("assertGenerationJobId") or "").strip()
         if not assert_generation_job_id:
             return make_response(error_response("缺少断言生成任务 ID"), 400)
@@ -172,7 +178,7 @@ def create_fuzz_job_handlers(
         if error:
             return error
 
-        data = request.get_json(silent=True) or {}
+        data = read_json_body(request) or {}
         fuzz_config_job_id = str(data.get("fuzzConfigJobId") or "").strip()
         config_snapshot: Optional[Dict[str, Any]] = None
         if fuzz_config_job_id:
@@ -423,16 +429,24 @@ def _is_path_inside(path: Path, roots: list[Path]) -> bool:
 
 
 def _latest_instrumented_code_zip() -> Optional[Path]:
-    candidates: list[Path] = []
+    # One stat per match both filters out non-files and yields the mtime used
+    # for ordering, instead of is_file() followed by stat() for every match.
+    latest: Optional[Path] = None
+    latest_mtime = 0.0
     for root in _instrumented_zip_discovery_roots():
         if not root.exists():
             continue
-        candidates.extend(
-            path for path in root.rglob("instrumented_code.zip") if path.is_file()
-        )
-    if not candidates:
-        return None
-    return max(candidates, key=lambda path: path.stat().st_mtime)
+        for path in root.rglob("instrumented_code.zip"):
+            try:
+                stat_result = path.stat()
+            except OSError:
+                continue
+            if not stat.S_ISREG(stat_result.st_mode):
+                continue
+            if latest is None or stat_result.st_mtime > latest_mtime:
+                latest = path
+                latest_mtime = stat_result.st_mtime
+    return latest
 
 
 def _instrumented_code_zip_path(result: Optional[Dict[str, object]]) -> Optional[Path]:
@@ -659,16 +673,9 @@ def _refresh_process_state(snapshot: Dict[str, Any]) -> None:
     container_id = process.get("containerId")
     if not isinstance(container_id, str) or not container_id:
         return
-    log_file = _job_log_file(snapshot)
-    result = subprocess.run(
-        f"docker ps -q --filter id={container_id}",
-        shell=True,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-    )
-    if result.returncode == 0 and result.stdout.strip():
+    if _is_container_running(container_id):
         return
+    log_file = _job_log_file(snapshot)
     status = _container_status_line(container_id)
     _append_log(
         log_file, f"Fuzzer container is no longer running: {status or container_id}"
@@ -690,15 +697,19 @@ def _read_job_log(snapshot: Dict[str, Any], from_position: int) -> Dict[str, Any
     log_file = Path(str(job_log or ""))
     content = ""
     position = from_position
-    if log_file.exists():
+    file_size = 0
+    try:
         with log_file.open("r", encoding="utf-8", errors="replace") as handle:
             handle.seek(from_position)
             content = handle.read()
             position = handle.tell()
+            file_size = os.fstat(handle.fileno()).st_size
+    except FileNotFoundError:
+        pass
     payload: Dict[str, Any] = {
         "content": content,
         "position": position,
-        "fileSize": log_file.stat().st_size if log_file.exists() else 0,
+        "fileSize": file_size,
         "job": refreshed_snapshot,
     }
     for key in (
@@ -936,7 +947,7 @@ def _job_log_file(snapshot: Dict[str, Any]) -> Path:
 
 def _append_log(log_file: Path, message: str) -> None:
     log_file.parent.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now().strftime("%H:%M:%S")
+    timestamp = time.strftime("%H:%M:%S")
     with log_file.open("a", encoding="utf-8") as handle:
         handle.write(f"[{timestamp}] {message}\n")
     _emit_backend_log(log_file, message)
@@ -1025,6 +1036,28 @@ def _path_preview_lines(root: Path, *, limit: int) -> list[str]:
     return lines or ["<empty>"]
 
 
+def _is_container_running(container_id: str) -> bool:
+    checked_at = _container_running_checked_at.get(container_id)
+    now = time.monotonic()
+    if (
+        checked_at is not None
+        and now - checked_at < CONTAINER_RUNNING_CACHE_TTL_SECONDS
+    ):
+        return True
+    result = subprocess.run(
+        f"docker ps -q --filter id={container_id}",
+        shell=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    if result.returncode == 0 and result.stdout.strip():
+        _container_running_checked_at[container_id] = now
+        return True
+    _container_running_checked_at.pop(container_id, None)
+    return False
+
+
 def _container_status_line(container_id: str) -> Optional[str]:
     result = subprocess.run(
         [
@@ -1048,6 +1081,7 @@ def _container_status_line(container_id: str) -> Optional[str]:
 
 
 def _stop_container(container_id: str) -> None:
+    _container_running_checked_at.pop(container_id, None)
     subprocess.run(
         ["docker", "stop", container_id],
         stdout=subprocess.PIPE,
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
+import os
 import sqlite3
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
+
+import orjson
 
 
 def _data_dir(base_dir: Path | None = None) -> Path:
@@ -26,14 +30,35 @@ def _history_file(base_dir: Path | None = None) -> Path:
     return _data_dir(base_dir) / "query_history.json"
 
 
+_history_cache: Dict[Path, Tuple[Tuple[int, int], Any]] = {}
+_detection_results_cache: Dict[Path, Tuple[Tuple[Any, ...], List[Dict[str, Any]]]] = {}
+
+
+def _file_signature(path: Path) -> Tuple[int, int]:
+    stat_result = path.stat()
+    return stat_result.st_mtime_ns, stat_result.st_size
+
+
+def _database_signature(db_path: Path) -> Tuple[Any, ...]:
+    db_signature = _file_signature(db_path)
+    wal_path = db_path.with_name(f"{db_path.name}-wal")
+    try:
+        wal_signature: Any = _file_signature(wal_path)
+    except FileNotFoundError:
+        wal_signature = None
+    return db_signature, wal_signature
+
+
 def read_detection_results(
     implementation_name: str,
     *,
     base_dir: Path | None = None,
 ) -> List[Dict[str, Any]]:
     db_path = _database_path(implementation_name, base_dir)
-    if not db_path.exists():
-        raise FileNotFoundError(db_path)
+    signature = _database_signature(db_path)
+    cached = _detection_results_cache.get(db_path)
+    if cached is not None and cached[0] == signature:
+        return list(cached[1])
 
     with sqlite3.connect(db_path) as conn:
         conn.row_factory = sqlite3.Row
@@ -49,7 +74,7 @@ def read_detection_results(
         llm_response: Dict[str, Any] = {}
         if row["llm_response"]:
             try:
-                llm_response = json.loads(row["llm_response"])
+                llm_response = orjson.loads(row["llm_response"])
             except json.JSONDecodeError:
                 llm_response = {"result": "error", "reason": "解析失败"}
 
@@ -60,7 +85,8 @@ def read_detection_results(
             "llm_response": llm_response,
         })
 
-    return items
+    _detection_results_cache[db_path] = (signature, items)
+    return list(items)
 
 
 def list_available_implementations(*, base_dir: Path | None = None) -> List[str]:
@@ -79,11 +105,18 @@ def list_available_implementations(*, base_dir: Path | None = None) -> List[str]
 
 def read_analysis_history(*, base_dir: Path | None = None) -> Any:
     history_file = _history_file(base_dir)
-    if not history_file.exists():
+    try:
+        signature = _file_signature(history_file)
+    except FileNotFoundError:
         return []
 
-    with history_file.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    cached = _history_cache.get(history_file)
+    if cached is None or cached[0] != signature:
+        cached = (signature, orjson.loads(history_file.read_bytes()))
+        _history_cache[history_file] = cached
+
+    history = cached[1]
+    return list(history) if isinstance(history, list) else history
 
 
 def _detection_statistics(
@@ -109,7 +142,7 @@ def _detection_statistics(
     for row in rows:
         if row[0]:
             try:
-                response = json.loads(row[0])
+                response = orjson.loads(row[0])
                 result = response.get("result", "").lower()
                 if "no violation" in result:
                     statistics["noViolations"] += 1
@@ -146,5 +179,12 @@ def append_analysis_history(
     })
     history = history[:50]
 
-    with history_file.open("w", encoding="utf-8") as f:
-        json.dump(history, f, ensure_ascii=False, indent=2)
+    tmp_file = history_file.with_name(f"{history_file.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        tmp_file.write_bytes(orjson.dumps(history))
+        os.replace(tmp_file, history_file)
+    except OSError:
+        with contextlib.suppress(OSError):
+            tmp_file.unlink()
+        raise
+    _history_cache[history_file] = (_file_signature(history_file), history)
@@ -18,6 +18,13 @@ from .legacy_analysis_history import (
 )
 
 
+def _conditional_response(payload: Any):
+    # The frontend re-polls these read-only views; let unchanged bodies 304.
+    response = make_response(payload)
+    response.add_etag()
+    return response.make_conditional(request)
+
+
 def create_legacy_analysis_handlers(
     ensure_authenticated: Callable[[], tuple[object, object]],
 ) -> dict[str, Callable[..., Any]]:
@@ -40,7 +47,7 @@ def create_legacy_analysis_handlers(
                 500,
             )
 
-        return success_response({"items": items})
+        return _conditional_response(success_response({"items": items}))
 
     def list_available_implementations():
         """获取所有可用的协议实现列表"""
@@ -59,7 +66,7 @@ def create_legacy_analysis_handlers(
 
         try:
             history = read_analysis_history()
-            return success_response({"items": history})
+            return _conditional_response(success_response({"items": history}))
         except (json.JSONDecodeError, IOError) as e:
             return make_response(
                 error_response(f"读取历史记录失败: {str(e)}"),
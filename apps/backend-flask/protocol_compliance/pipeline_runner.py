@@ -52,6 +52,9 @@ PIPELINE_ROOT = (Path(__file__).resolve().parents[1] / "protocol_extract").resol
 STORAGE_ROOT = PIPELINE_ROOT / "project_store"
 UPLOAD_ROOT = PIPELINE_ROOT / "uploads"
 LOG_ROOT = PIPELINE_ROOT / "logs"
+# FileStorage.save copies in 16 KiB chunks by default; larger reads cut the
+# syscall count when persisting big protocol documents.
+UPLOAD_COPY_BUFFER_BYTES = 1024 * 1024
 
 
 UPLOAD_ROOT.mkdir(parents=True, exist_ok=True)
@@ -148,7 +151,7 @@ def _save_upload(upload: FileStorage) -> Path:
     token = uuid.uuid4().hex
     safe_name = _sanitize_segment(Path(filename).stem, "protocol")
     target = UPLOAD_ROOT / f"{safe_name}-{token}{suffix}"
-    upload.save(target)
+    upload.save(target, buffer_size=UPLOAD_COPY_BUFFER_BYTES)
     return target
 
 
@@ -129,6 +129,8 @@ bp = Blueprint("protocol_compliance", __name__, url_prefix="/api/protocol-compli
 
 VISIBLE_VIOLATION_HISTORY_LIMIT = 5
 
+_PACKAGE_DIR = Path(__file__).resolve().parent
+
 submit_static_analysis_job = _submit_static_analysis_job_impl
 
 
@@ -354,7 +356,7 @@ def _row_history_time_marker(
 def _candidate_database_history_times(db_path: Path) -> List[str]:
     return _candidate_database_history_times_impl(
         db_path,
-        package_dir=Path(__file__).resolve().parent,
+        package_dir=_PACKAGE_DIR,
     )
 
 
@@ -365,7 +367,7 @@ def _database_history_display_time(
 ) -> str:
     return _database_history_display_time_impl(
         db_path,
-        package_dir=Path(__file__).resolve().parent,
+        package_dir=_PACKAGE_DIR,
         persist_if_missing=persist_if_missing,
     )
 
@@ -2,19 +2,23 @@
 
 from __future__ import annotations
 
+import heapq
 import json
 import logging
 import sqlite3
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, cast
 
 from flask import make_response, request
 
+from utils.payloads import read_json_body
 from utils.responses import error_response, success_response
 
 LOGGER = logging.getLogger(__name__)
+OVERVIEW_READ_WORKERS = 8
 
 
 def create_static_analysis_history_handlers(
@@ -115,20 +119,32 @@ def create_static_analysis_history_handlers(
                 result_backed_job_ids.add(str(job_id))
             absorb_overview_item(item, findings)
 
-        for source in sources:
-            if (
+        pending_sources = [
+            source
+            for source in sources
+            if not (
                 source.get("sourceType") == "job"
                 and source.get("jobId")
                 and str(source.get("jobId")) in result_backed_job_ids
-            ):
-                continue
-            db_path = cast(Path, source["path"])
-            item, findings, table_counts, db_warnings = read_overview_from_database(
-                db_path,
+            )
+        ]
+
+        def read_source_overview(source: Dict[str, Any]):
+            return read_overview_from_database(
+                cast(Path, source["path"]),
                 protocol_name=cast(Optional[str], source.get("protocolName")),
             )
-            warnings.extend(db_warnings)
-            absorb_overview_item(item, findings, table_counts)
+
+        # Each database is opened on its own connection, so the reads can
+        # overlap; executor.map keeps the results in source order.
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(OVERVIEW_READ_WORKERS, len(pending_sources)))
+        ) as executor:
+            for item, findings, table_counts, db_warnings in executor.map(
+                read_source_overview, pending_sources
+            ):
+                warnings.extend(db_warnings)
+                absorb_overview_item(item, findings, table_counts)
 
         implementations = list(implementation_groups.values())
         for item in implementations:
@@ -143,12 +159,12 @@ def create_static_analysis_history_handlers(
                 set[str],
                 item.pop("_violationLocationKeys", set()),
             )
-            result_values = list(rule_status_by_key.values())
+            status_counts = Counter(rule_status_by_key.values())
             item["analysisRecords"] = len(rule_status_by_key)
             item["ruleResults"] = len(rule_status_by_key)
-            item["violationRules"] = result_values.count("violation_found")
-            item["noViolationRules"] = result_values.count("no_violation")
-            item["unknownRules"] = result_values.count("unknown")
+            item["violationRules"] = status_counts["violation_found"]
+            item["noViolationRules"] = status_counts["no_violation"]
+            item["unknownRules"] = status_counts["unknown"]
             item["violationLocations"] = len(violation_location_keys)
             item["codeSnippets"] = len(code_snippet_rule_keys)
 
@@ -338,8 +354,13 @@ def create_static_analysis_history_handlers(
                 and item_time >= cutoff
             ]
 
-        items.sort(key=lambda item: str(item.get("updatedAt") or ""), reverse=True)
-        visible_items = items[:visible_violation_history_limit]
+        # Only the newest few are returned, so select them without sorting
+        # every matching row; equivalent to sort(reverse=True)[:limit].
+        visible_items = heapq.nlargest(
+            visible_violation_history_limit,
+            items,
+            key=lambda item: str(item.get("updatedAt") or ""),
+        )
         payload: Dict[str, Any] = {
             "items": visible_items,
             "count": len(visible_items),
@@ -358,7 +379,7 @@ def create_static_analysis_history_handlers(
             return make_response(error_response("无效的历史记录 ID"), 400)
 
         job_limit = to_int(request.args.get("jobLimit"), 200)
-        delete_payload = request.get_json(silent=True)
+        delete_payload = read_json_body(request)
         delete_payload = delete_payload if isinstance(delete_payload, dict) else {}
         tombstone_item: Dict[str, Any] = {**delete_payload, "id": item_id}
         if delete_payload and is_violation_history_deleted(tombstone_item):
@@ -453,7 +474,7 @@ def create_static_analysis_history_handlers(
         if error:
             return error
 
-        payload = request.get_json(silent=True)
+        payload = read_json_body(request)
         if not isinstance(payload, dict):
             return make_response(error_response("请求体必须为 JSON 对象"), 400)
 
@@ -11,6 +11,7 @@ from typing import Any, Callable, Dict, List, Optional
 
 from flask import make_response, request
 
+from utils.payloads import read_json_body
 from utils.responses import error_response, success_response
 
 from .static_analysis_models import (
@@ -43,7 +44,7 @@ class StaticAnalysisDatabaseInsightsHandler:
         if error:
             return error
 
-        payload = request.get_json(silent=True)
+        payload = read_json_body(request)
         if payload is None:
             return make_response(
                 error_response("请求体必须为 JSON 对象"),
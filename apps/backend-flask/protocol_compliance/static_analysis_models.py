@@ -8,6 +8,8 @@ import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import orjson
+
 PROTOCOL_BY_IMPLEMENTATION = {
     "freecoap": "CoAP",
     "libcoap": "CoAP",
@@ -50,7 +52,7 @@ def _parse_llm_response(payload: Any) -> Dict[str, Any]:
         if not payload or payload.lower() == "null":
             return {}
         try:
-            decoded = json.loads(payload)
+            decoded = orjson.loads(payload)
         except json.JSONDecodeError:
             return {"raw": payload}
         payload = decoded
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import sqlite3
+from collections import Counter
 from pathlib import Path
 from typing import Any, Dict, List, Optional, cast
 
@@ -111,15 +112,16 @@ def _read_overview_from_database(
 
     conn.close()
 
+    status_counts = Counter(rule_status_by_key.values())
     item = {
         "name": implementation_name,
         "protocol": resolved_protocol,
         "database": db_path.name,
         "analysisRecords": len(rule_status_by_key),
         "ruleResults": len(rule_status_by_key),
-        "violationRules": list(rule_status_by_key.values()).count("violation_found"),
-        "noViolationRules": list(rule_status_by_key.values()).count("no_violation"),
-        "unknownRules": list(rule_status_by_key.values()).count("unknown"),
+        "violationRules": status_counts["violation_found"],
+        "noViolationRules": status_counts["no_violation"],
+        "unknownRules": status_counts["unknown"],
         "violationLocations": len(violation_location_keys),
         "codeSnippets": len(code_snippet_rule_keys),
         "_ruleStatusByKey": rule_status_by_key,
@@ -179,15 +181,16 @@ def _read_overview_from_analysis_result(
                 }
             )
 
+    status_counts = Counter(rule_status_by_key.values())
     item = {
         "name": implementation_name,
         "protocol": resolved_protocol,
         "database": database_name,
         "analysisRecords": len(rule_status_by_key),
         "ruleResults": len(rule_status_by_key),
-        "violationRules": list(rule_status_by_key.values()).count("violation_found"),
-        "noViolationRules": list(rule_status_by_key.values()).count("no_violation"),
-        "unknownRules": list(rule_status_by_key.values()).count("unknown"),
+        "violationRules": status_counts["violation_found"],
+        "noViolationRules": status_counts["no_violation"],
+        "unknownRules": status_counts["unknown"],
         "violationLocations": len(violation_location_keys),
         "codeSnippets": len(code_snippet_rule_keys),
         "_ruleStatusByKey": rule_status_by_key,
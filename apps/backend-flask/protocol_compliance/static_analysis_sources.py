@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+from fnmatch import fnmatchcase
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
@@ -12,6 +14,19 @@ WritableCopyIterator = Callable[[], List[Dict[str, Any]]]
 PathHasher = Callable[[Path], str]
 
 
+def _scan_builtin_databases(db_dir: Path) -> Optional[List[os.DirEntry[str]]]:
+    """List ``sqlite_*.db`` entries of *db_dir* in one directory read."""
+    try:
+        with os.scandir(db_dir) as entries:
+            matches = [
+                entry for entry in entries if fnmatchcase(entry.name, "sqlite_*.db")
+            ]
+    except OSError:
+        return None
+    matches.sort(key=lambda entry: entry.name)
+    return matches
+
+
 def iter_static_analysis_database_sources(
     *,
     db_dir: Path,
@@ -39,9 +54,17 @@ def iter_static_analysis_database_sources(
         sources.append(source)
 
     if include_builtin:
-        if db_dir.is_dir():
-            for db_path in sorted(db_dir.glob("sqlite_*.db")):
-                resolved = str(db_path.resolve())
+        builtin_entries = _scan_builtin_databases(db_dir)
+        if builtin_entries is not None:
+            resolved_dir = db_dir.resolve()
+            for entry in builtin_entries:
+                db_path = Path(entry.path)
+                # Only symlinked entries can resolve outside db_dir.
+                resolved = str(
+                    db_path.resolve()
+                    if entry.is_symlink()
+                    else resolved_dir / entry.name
+                )
                 if sqlite_path_hash(db_path) in shadowed_database_hashes:
                     continue
                 seen_database_paths.add(resolved)
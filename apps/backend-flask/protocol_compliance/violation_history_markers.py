@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import hashlib
 import re
+import stat
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Dict, List, cast
@@ -69,15 +70,16 @@ def _candidate_database_history_times(
         Path.cwd() / "database" / db_path.name,
     ]:
         try:
-            if candidate.is_file():
-                candidates.append(
-                    datetime.fromtimestamp(
-                        candidate.stat().st_mtime,
-                        timezone.utc,
-                    ).isoformat()
-                )
+            stat_result = candidate.stat()
         except OSError:
             continue
+        if stat.S_ISREG(stat_result.st_mode):
+            candidates.append(
+                datetime.fromtimestamp(
+                    stat_result.st_mtime,
+                    timezone.utc,
+                ).isoformat()
+            )
     return candidates
 
 
@@ -2,22 +2,28 @@
 
 from __future__ import annotations
 
+import contextlib
 import hashlib
 import json
 import logging
 import os
 import re
+import uuid
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
 
 LOGGER = logging.getLogger(__name__)
 
+_DEFAULT_STATE_DIR = Path(__file__).resolve().parent / "_state"
+
 
 def _violation_history_timestamp_store_path() -> Path:
     state_dir = Path(
         os.environ.get(
             "PROTOCOLGUARD_STATE_DIR",
-            str(Path(__file__).resolve().parent / "_state"),
+            str(_DEFAULT_STATE_DIR),
         )
     ).expanduser()
     return state_dir / "violation_history_timestamps.json"
@@ -46,34 +52,72 @@ def _violation_history_writable_database_path(
     )
 
 
+def _empty_violation_history_timestamps() -> Dict[str, Any]:
+    return {"databases": {}, "deleted": {}, "rows": {}}
+
+
+# Parsed timestamp store keyed on its (st_mtime_ns, st_size) signature. Callers
+# mutate the returned dict before saving it, so each call gets its own copy and
+# every save drops the entry.
+_timestamp_store_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+def _copy_violation_history_timestamps(timestamps: dict[str, Any]) -> dict[str, Any]:
+    return {key: dict(value) for key, value in timestamps.items()}
+
+
 def _load_violation_history_timestamps() -> Dict[str, Any]:
     store_path = _violation_history_timestamp_store_path()
-    if not store_path.is_file():
-        return {"databases": {}, "deleted": {}, "rows": {}}
     try:
-        payload = json.loads(store_path.read_text(encoding="utf-8"))
+        stat_result = store_path.stat()
+    except FileNotFoundError:
+        return _empty_violation_history_timestamps()
+    except OSError as exc:
+        LOGGER.warning("Failed to read violation history timestamps: %s", exc)
+        return _empty_violation_history_timestamps()
+    signature = (stat_result.st_mtime_ns, stat_result.st_size)
+    cached = _timestamp_store_cache.get(store_path)
+    if cached is not None and cached[0] == signature:
+        return _copy_violation_history_timestamps(cached[1])
+
+    try:
+        payload = orjson.loads(store_path.read_bytes())
+    except FileNotFoundError:
+        return _empty_violation_history_timestamps()
     except (OSError, json.JSONDecodeError) as exc:
         LOGGER.warning("Failed to read violation history timestamps: %s", exc)
-        return {"databases": {}, "deleted": {}, "rows": {}}
+        return _empty_violation_history_timestamps()
     if not isinstance(payload, dict):
-        return {"databases": {}, "deleted": {}, "rows": {}}
+        return _empty_violation_history_timestamps()
     databases = payload.get("databases")
     deleted = payload.get("deleted")
     rows = payload.get("rows")
-    return {
+    timestamps = {
         "databases": databases if isinstance(databases, dict) else {},
         "deleted": deleted if isinstance(deleted, dict) else {},
         "rows": rows if isinstance(rows, dict) else {},
     }
+    _timestamp_store_cache[store_path] = (signature, timestamps)
+    return _copy_violation_history_timestamps(timestamps)
 
 
 def _save_violation_history_timestamps(payload: Dict[str, Any]) -> None:
     store_path = _violation_history_timestamp_store_path()
+    # Readers poll this file while routes update it, so write a sibling file
+    # and rename it into place rather than truncating the store mid-read.
+    tmp_path = store_path.with_name(f"{store_path.name}.{uuid.uuid4().hex}.tmp")
     try:
         store_path.parent.mkdir(parents=True, exist_ok=True)
-        store_path.write_text(
-            json.dumps(payload, ensure_ascii=False, indent=2, sort_keys=True),
-            encoding="utf-8",
+        tmp_path.write_bytes(
+            orjson.dumps(
+                payload,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            )
         )
+        os.replace(tmp_path, store_path)
     except OSError as exc:
         LOGGER.warning("Failed to write violation history timestamps: %s", exc)
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+    finally:
+        _timestamp_store_cache.pop(store_path, None)
@@ -114,7 +114,8 @@ def main():
         "output_excel": document_dir / "sentences_analysis.xlsx",
         "text_processed": document_dir / "text_processed.json",
         "dissector": document_dir / f"packet-{args.protocol.lower()}.c",
-        "tables": document_dir / "tables.txt"
+        "tables": document_dir / "tables.txt",
+        "llm_cache": document_dir / "llm_cache"
     }
 
     # 转换为字符串路径
@@ -1,61 +1,23 @@
 import html2text
-from lxml import html
+from lxml import etree, html
 
+# 预编译的 XPath 查询，避免每次调用重新编译表达式
+_XPATH_GREY_SPANS = etree.XPath("//span[contains(@class, 'grey')]")
+_XPATH_LINE_BREAKS = etree.XPath("//br | //hr")
+_XPATH_NEWPAGES = etree.XPath("//pre[@class='newpage']")
+_XPATH_COMMENTS = etree.XPath("//comment()")
+_XPATH_HEADING_SPANS = etree.XPath('//span[starts-with(@class, "h")]')
 
-def extract_and_save_tables(html_path, output_json_path):
-    with open(html_path, "r", encoding="utf-8", errors="ignore") as f:
-        tree = html.fromstring(f.read())
 
-    tables_data = []
-    for i, table in enumerate(tree.xpath("//table"), start=1):
-        # ---- 获取表格标题（向上找最近的段落或标题标签）----
-        title = ""
-        prev = table.getprevious()
-        while prev is not None:
-            if prev.tag in ["p", "h1", "h2", "h3", "h4", "h5", "h6"]:
-                title = " ".join(prev.text_content().split())
-                break
-            prev = prev.getprevious()
-
-        # ---- 解析表格 ----
-        rows_data = []
-        for row in table.xpath(".//tr"):
-            row_data = []
-            for cell in row.xpath(".//th|.//td"):
-                text = " ".join(cell.text_content().split())
-                colspan = int(cell.attrib.get("colspan", 1))
-                rowspan = int(cell.attrib.get("rowspan", 1))
-                row_data.append({
-                    "text": text,
-                    "colspan": colspan,
-                    "rowspan": rowspan
-                })
-            if row_data:
-                rows_data.append(row_data)
-
-        tables_data.append({
-            "title": title,
-            "rows": rows_data
-        })
-
-    #with open(output_json_path, "w", encoding="utf-8") as f:
-    #    json.dump(tables_data, f, ensure_ascii=False, indent=2)
-
-
-def clean_rfc_html(file_path, output_path, tables_json_path):
-    # 1. 先提取表格
-    extract_and_save_tables(file_path, tables_json_path)
-
-    # 2. 读取 HTML 并删除表格
+def clean_rfc_html(file_path, output_path):
+    # 读取 HTML（表格保留在正文中，由 html2text 一并转换；tables.json 由 process_tables 生成）
     with open(file_path, 'r', encoding='utf-8', errors='ignore') as file:
         content = file.read()
 
-    # 删除所有表格标签及内容
-    #content = re.sub(r"<table.*?</table>", "", content, flags=re.DOTALL | re.IGNORECASE)
     tree = html.fromstring(content)
 
     # 清理页眉页脚
-    for element in tree.xpath("//span[contains(@class, 'grey')]"):
+    for element in _XPATH_GREY_SPANS(tree):
         parent = element.getparent()
         if element.tail:
             previous = element.getprevious()
@@ -66,11 +28,11 @@ def clean_rfc_html(file_path, output_path, tables_json_path):
         parent.remove(element)
 
     # 清理换行标签
-    for element in tree.xpath("//br | //hr"):
+    for element in _XPATH_LINE_BREAKS(tree):
         element.getparent().remove(element)
 
     # 处理分页符
-    for element in tree.xpath("//pre[@class='newpage']"):
+    for element in _XPATH_NEWPAGES(tree):
         parent = element.getparent()
         if element.text:
             parent.text = (parent.text or "") + element.text
@@ -85,7 +47,7 @@ def clean_rfc_html(file_path, output_path, tables_json_path):
         parent.remove(element)
 
     # 删除注释
-    for comment in tree.xpath('//comment()'):
+    for comment in _XPATH_COMMENTS(tree):
         parent = comment.getparent()
         if parent is not None:
             parent.remove(comment)
@@ -101,7 +63,7 @@ def html_to_markdown(file_path, output_path):
         tree = html.parse(file)
 
     # 转换标题标签
-    for span in tree.xpath('//span[starts-with(@class, "h")]'):
+    for span in _XPATH_HEADING_SPANS(tree):
         class_name = span.get('class')
         if class_name and class_name[1:].isdigit():
             new_tag = html.Element(f'h{class_name[1:]}')
@@ -125,7 +87,6 @@ def process_html(config):
     clean_rfc_html(
         config["paths"]["html_input"],
         config["paths"]["cleaned_html"],
-        config["paths"]["tables"]
     )
     html_to_markdown(config["paths"]["cleaned_html"], config["paths"]["markdown"])
     print("* HTML processing completed")
@@ -2,6 +2,7 @@ import ast
 import re
 import json
 import os
+import orjson
 from openai import OpenAI
 from collections import defaultdict
 import toml
@@ -131,8 +132,8 @@ def filter_headings(config):
             raise ValueError("Empty heading selection response")
         selected = _parse_selected_headings(content)
         selected = _resolve_selected_headings(selected, headings)
-        with open(config["paths"]["headings"], "w", encoding="utf-8") as f:
-            json.dump(selected, f, ensure_ascii=False)
+        with open(config["paths"]["headings"], "wb") as f:
+            f.write(orjson.dumps(selected))
         print(f"✅ Selected {len(selected)} headings")
     except Exception as e:
         print(f"❌ Heading selection failed: {str(e)}")
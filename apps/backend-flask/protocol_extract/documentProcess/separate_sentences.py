@@ -1,10 +1,13 @@
+import asyncio
+import contextlib
+import hashlib
 import re
 import json
 import os
+import orjson
 import pandas as pd
 from tenacity import retry, stop_after_attempt, wait_random_exponential
-from openai import OpenAI
-import concurrent.futures
+from openai import AsyncOpenAI
 from typing import Any
 
 from tqdm import tqdm
@@ -24,16 +27,20 @@ this_url = (
 )
 PROMPT_TEMPLATE = toml_prompt["prompt_separate_sentences"]["user"]
 this_model = toml_config["llm"]["model1"]
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
 
 def sanitize_text(text: str, limit: int = 10000) -> str:
     if text and len(text) > limit:
         return text[:limit] + "\n...[TRUNCATED]..."
     return text or ""
 
+def build_prompt(heading, sentence):
+    return PROMPT_TEMPLATE.format(heading=sanitize_text(heading, 2000), sentence=sanitize_text(sentence, 12000))
+
+
 @retry(stop=stop_after_attempt(3), wait=wait_random_exponential(min=1, max=10))
-def process_sentence(client, heading, sentence):
-    prompt = PROMPT_TEMPLATE.format(heading=sanitize_text(heading, 2000), sentence=sanitize_text(sentence, 12000)) 
-    response = client.chat.completions.create(
+async def process_sentence(client, prompt):
+    response = await client.chat.completions.create(
         model=this_model,
         messages=[
             {"role": "user", "content": prompt}
@@ -45,65 +52,106 @@ def process_sentence(client, heading, sentence):
     return response.choices[0].message.content.strip()
 
 
-def process_sentences(config):
-    print("🔄 Processing sentences...")
+def _cache_path(cache_dir, prompt):
+    key = hashlib.blake2b(f"{this_model}\x00{prompt}".encode("utf-8"), digest_size=16).hexdigest()
+    return Path(cache_dir) / f"{key}.json"
 
-    # 加载数据
-    with open(config["paths"]["text_processed"], "r") as f:
-        headings = json.load(f)
-    with open(config["paths"]["headings"], "r") as f:
-        selected = json.load(f)
 
-    client = OpenAI(api_key=config["api_key"], base_url=this_url)
+def _read_cached_response(path):
+    try:
+        return orjson.loads(path.read_bytes())["content"]
+    except (OSError, orjson.JSONDecodeError, KeyError, TypeError):
+        return None
+
+
+def _write_cached_response(path, content):
+    """写入缓存失败不影响本次结果，只打印警告"""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(orjson.dumps({"content": content}))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"[WARN] 写入大模型缓存失败: {path} - {e}")
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+
+
+async def _process_chapters(config, headings, chapters):
+    """在单个事件循环中并发请求各章节，并发数由 this_workers 限制"""
     results = {}
     df_data: list[list[Any]] = []
+    semaphore = asyncio.Semaphore(this_workers)  # 减少并发数避免超限
+    # 以模型+提示词的哈希缓存响应，重复处理同一文档时未变化的章节不再请求大模型
+    cache_dir = config["paths"].get("llm_cache")
 
-    # 使用tqdm进度条
-    with tqdm(total=len(selected), desc="处理章节") as pbar:
-        with concurrent.futures.ThreadPoolExecutor(max_workers=this_workers) as executor:  # 减少并发数避免超限
-            futures = {}
-
-            # 提交章节级任务
-            print(f"[DEBUG] selected章节数: {len(selected)}")
-            print(f"[DEBUG] headings章节数: {len(headings)}")
-            print(f"[DEBUG] selected章节示例: {list(selected)[:5]}")
-            print(f"[DEBUG] headings章节示例: {list(headings)[:5]}")
-            for heading in selected:
-                if heading in headings:
-                    section_text = str(headings[heading] or '').strip()
-                    if not section_text:
-                        print(f"[WARN] {heading} 在headings中但内容为空，跳过")
-                        continue
-                    sentences = [s for s in re.split(r'(?<=[.!?])\s+', section_text) if s.strip()]
-                    if not sentences:
-                        print(f"[WARN] {heading} 内容分句后为空，跳过")
-                        continue
-                    futures[executor.submit(process_sentence, client, heading, section_text)] = heading
-                else:
-                    print(f"[WARN] {heading} 不在headings中，跳过")
-
-            # 处理结果
-            for future in concurrent.futures.as_completed(futures):
-                heading = futures[future]
+    async with AsyncOpenAI(api_key=config["api_key"], base_url=this_url) as client:
+        async def run(heading, section_text, sentences):
+            prompt = build_prompt(heading, section_text)
+            cache_path = _cache_path(cache_dir, prompt) if cache_dir else None
+            # 缓存读写是阻塞文件 I/O，放到线程中执行以免阻塞事件循环
+            if cache_path is not None:
+                cached = await asyncio.to_thread(_read_cached_response, cache_path)
+                if cached is not None:
+                    return heading, sentences, cached, None
+            async with semaphore:
                 try:
-                    optimized_text = future.result()
+                    optimized_text = await process_sentence(client, prompt)
+                except Exception as e:
+                    return heading, sentences, None, e
+            if cache_path is not None:
+                await asyncio.to_thread(_write_cached_response, cache_path, optimized_text)
+            return heading, sentences, optimized_text, None
+
+        # 使用tqdm进度条
+        with tqdm(total=len(chapters), desc="处理章节") as pbar:
+            for task in asyncio.as_completed([run(*chapter) for chapter in chapters]):
+                heading, original_sentences, optimized_text, error = await task
+                if error is None:
                     results[heading] = optimized_text
 
                     # 记录到DataFrame
-                    original_sentences = re.split(r'(?<=[.!?])\s+', headings[heading])
-                    optimized_sentences = re.split(r'(?<=[.!?])\s+', optimized_text)
+                    optimized_sentences = _SENTENCE_SPLIT_RE.split(optimized_text)
                     for orig, opt in zip(original_sentences, optimized_sentences):
                         df_data.append([heading, orig, opt])
-
-                except Exception as e:
-                    print(f"❌ 章节处理失败: {heading} - {str(e)}")
+                else:
+                    print(f"❌ 章节处理失败: {heading} - {str(error)}")
                     results[heading] = headings[heading]  # 保留原始内容
-                finally:
-                    pbar.update(1)
+                pbar.update(1)
+
+    return results, df_data
+
+
+def process_sentences(config):
+    print("🔄 Processing sentences...")
+
+    # 加载数据
+    with open(config["paths"]["text_processed"], "r") as f:
+        headings = json.load(f)
+    with open(config["paths"]["headings"], "r") as f:
+        selected = json.load(f)
+
+    # 筛选章节级任务；分句结果随任务保存，供写入 DataFrame 时复用
+    chapters = []
+    for heading in selected:
+        if heading in headings:
+            section_text = str(headings[heading] or '').strip()
+            if not section_text:
+                print(f"[WARN] {heading} 在headings中但内容为空，跳过")
+                continue
+            sentences = [s for s in _SENTENCE_SPLIT_RE.split(section_text) if s.strip()]
+            if not sentences:
+                print(f"[WARN] {heading} 内容分句后为空，跳过")
+                continue
+            chapters.append((heading, section_text, sentences))
+        else:
+            print(f"[WARN] {heading} 不在headings中，跳过")
+
+    results, df_data = asyncio.run(_process_chapters(config, headings, chapters))
 
     # 保存结果
     df = pd.DataFrame(df_data, columns=pd.Index(["章节", "原句", "修正"]))
     df.to_excel(config["paths"]["output_excel"], index=False)
 
-    with open(config["paths"]["output_json"], "w", encoding='utf-8') as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
+    with open(config["paths"]["output_json"], "wb") as f:
+        f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
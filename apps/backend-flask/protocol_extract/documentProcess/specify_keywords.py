@@ -2,6 +2,7 @@ import json
 import os
 from pathlib import Path
 
+import orjson
 import toml
 from openai import OpenAI
 
@@ -51,9 +52,8 @@ def process_keywords(config):
             raise ValueError(
                 "Keyword extraction response must be a non-empty JSON object"
             )
-        Path(config["paths"]["keywords"]).write_text(
-            json.dumps(payload, ensure_ascii=False, indent=2),
-            encoding="utf-8",
+        Path(config["paths"]["keywords"]).write_bytes(
+            orjson.dumps(payload, option=orjson.OPT_INDENT_2)
         )
         print("✅ Keywords extracted")
     except Exception as e:
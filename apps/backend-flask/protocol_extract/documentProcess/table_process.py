@@ -1,5 +1,5 @@
-import json
 from pathlib import Path
+import orjson
 import toml
 
 # 获取当前脚本所在目录（保留配置读取，仅用于获取输出路径）
@@ -24,8 +24,8 @@ def process_tables(config, max_workers=this_workers):
 
     # 2. 生成空的 JSON 格式 tables.txt（符合原代码的字典结构，无有效图表）
     empty_results = {}  # 空字典，符合原代码格式规范
-    with open(tables_path, "w", encoding="utf-8") as f:
-        json.dump(empty_results, f, ensure_ascii=False, indent=2)
+    with open(tables_path, "wb") as f:
+        f.write(orjson.dumps(empty_results, option=orjson.OPT_INDENT_2))
 
     # 3. 生成空的 Markdown 文件
     save_markdown(empty_results, markdown_path)
@@ -1,9 +1,27 @@
+import io
 import re
-import json
+
+import orjson
+
+_LINK_RE = re.compile(r'\[([^\]]*)\]\([^\)]*\)')
+# HTML-to-Markdown converters may preserve source indentation before a
+# heading (RFC 959 does this for its first two sections).
+_HEADING_RE = re.compile(r'^\s*(#{1,6})\s+(.*)')
+_FILTER_START_RE = re.compile(r'\b1[\.\s]|^[A-Z]\.1\b')
+_TITLE_STRIP_RE = re.compile(r'^[0-9A-Z.:\s\[\]]+')
+_WS_RE = re.compile(r'\s+')
+
+# 单字符替换合并为 translate；删除 "\x96"/"$" 须在替换多字符序列之后进行，
+# 以免删除后拼出新的 "â\x80\x91"，与逐个 replace 的顺序保持一致
+_CLEAN_TEXT_TABLE = str.maketrans({
+    "\x92": "'", "\xa0": " ", "Â": "", "“": "\"", "”": "\""
+})
+_CLEAN_TEXT_SEQUENCES = (("â\x80\x91", "-"),)
+_CLEAN_TEXT_DELETE = str.maketrans("", "", "\x96$")
 
 
 def remove_links(text):
-    return re.sub(r'\[([^\]]*)\]\([^\)]*\)', r'\1', text)
+    return _LINK_RE.sub(r'\1', text)
 
 
 def remove_appendix_section(text):
@@ -20,22 +38,19 @@ def extract_markdown_hierarchy(file_path):
 
     result = {}
     heading_stack = []  # [(level, title)]
-    content_stack = []
-    # HTML-to-Markdown converters may preserve source indentation before a
-    # heading (RFC 959 does this for its first two sections).
-    heading_pattern = re.compile(r'^\s*(#{1,6})\s+(.*)')
+    content_buf = io.StringIO()
 
     def save_content():
         """保存当前 heading_stack 对应的内容到 result"""
-        if heading_stack and content_stack:
+        if heading_stack and content_buf.tell():
             path = [remove_links(h[1]) for h in heading_stack]
-            content = '\n'.join(content_stack).strip()
+            content = content_buf.getvalue().strip()
             if path and content:
                 result[" -> ".join(path)] = remove_appendix_section(content)
 
     for raw_line in text.split('\n'):
         line = raw_line.replace("\xa0", " ").rstrip()
-        match = heading_pattern.match(line)
+        match = _HEADING_RE.match(line)
         if match:
             # 新标题前保存上一个标题链的内容
             save_content()
@@ -48,9 +63,11 @@ def extract_markdown_hierarchy(file_path):
                 heading_stack.pop()
 
             heading_stack.append((level, heading_text))
-            content_stack = []
+            content_buf.seek(0)
+            content_buf.truncate()
         else:
-            content_stack.append(remove_links(line.strip()))
+            content_buf.write(remove_links(line.strip()))
+            content_buf.write('\n')
 
     # 处理最后一个标题链
     save_content()
@@ -62,11 +79,11 @@ def filter_headings_content(headings):
     started = False
     for heading, content in headings.items():
         # 识别数字编号（如"1.", "2."）或字母编号（如"A.1", "A.2"）
-        if re.search(r'\b1[\.\s]|^[A-Z]\.1\b', heading):
+        if _FILTER_START_RE.search(heading):
             started = True
         if started:
             #这里原本逻辑是只有注释这一行，67，68，69行是新添加的逻辑，主要是为了过滤掉参考文献和附录这两章节
-            title = re.sub(r'^[0-9A-Z.:\s\[\]]+', '', heading).strip().lower()
+            title = _TITLE_STRIP_RE.sub('', heading).strip().lower()
             # print(title)  # 注释掉以避免Windows控制台编码问题
             #if any(k in heading for k in ["References", "Appendix"]):
             if title in ("References", "Appendix"):
@@ -76,13 +93,10 @@ def filter_headings_content(headings):
 
 
 def clean_text(text):
-    replacements = {
-        "\x92": "'", "\xa0": " ", "Â": "", "â\x80\x91": "-",
-        "“": "\"", "”": "\"", "\x96": "", "$": ""
-    }
-    for k, v in replacements.items():
+    text = text.translate(_CLEAN_TEXT_TABLE)
+    for k, v in _CLEAN_TEXT_SEQUENCES:
         text = text.replace(k, v)
-    return re.sub(r'\s+', ' ', text).strip()
+    return _WS_RE.sub(' ', text.translate(_CLEAN_TEXT_DELETE)).strip()
 
 
 def process_text(config):
@@ -93,18 +107,23 @@ def process_text(config):
     headings_content = extract_markdown_hierarchy(md_path)
     filtered = filter_headings_content(headings_content)
 
-    # 清理文本
-    cleaned = {clean_text(k): clean_text(v) for k, v in filtered.items()}
+    # 清理文本，同时收集标题链（清理后重名的标题只保留一次，与 dict 键一致）
+    cleaned = {}
+    headings_list = []
+    for k, v in filtered.items():
+        heading = clean_text(k)
+        if heading not in cleaned:
+            headings_list.append(heading)
+        cleaned[heading] = clean_text(v)
 
     # 保存完整内容 JSON
     output_path = config["paths"]["text_processed"]
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(cleaned, f, ensure_ascii=False, indent=2)
+    with open(output_path, 'wb') as f:
+        f.write(orjson.dumps(cleaned, option=orjson.OPT_INDENT_2))
 
     # 保存所有标题链到 headings.json
-    headings_list = list(cleaned.keys())
-    with open(config["paths"]["headings"], 'w', encoding='utf-8') as f:
-        json.dump(headings_list, f, ensure_ascii=False, indent=2)
+    with open(config["paths"]["headings"], 'wb') as f:
+        f.write(orjson.dumps(headings_list, option=orjson.OPT_INDENT_2))
 
     print(f"* Text processing completed\n   内容已保存到: {output_path}\n   标题链已保存到: {config['paths']['headings']}")
     return cleaned
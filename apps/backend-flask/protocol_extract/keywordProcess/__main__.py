@@ -1,9 +1,9 @@
 import argparse
 import json
-import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Callable
 
 def create_default_config(store_dir: Path) -> dict:
     """生成默认配置，并返回 dict"""
@@ -34,47 +34,27 @@ def create_default_config(store_dir: Path) -> dict:
     print(f"✅ 已生成默认配置文件: {config_file}")
     return config
 
-def run_subprocess(script_name: str, config_file: Path, protocol: str, version: str, apikey: Optional[str] = None) -> None:
-    """执行子脚本"""
-    script_path = Path(__file__).parent / f"{script_name}.py"
-    if not script_path.exists():
-        print(f"❌ 找不到处理脚本: {script_path.name}")
-        sys.exit(1)
-
-    cmd = [
-        sys.executable,
-        str(script_path),
-        "--protocol", protocol,
-        "--version", version,
-        "--config", str(config_file)
-    ]
-    if apikey:
-        cmd += ["--apikey", apikey]
-
-    print(f"\n🚀 正在执行 {script_name.upper()}...")
+def run_step(step_name: str, step: Callable[[], None]) -> None:
+    """在当前进程内执行处理步骤，失败时以非零状态退出"""
+    print(f"\n🚀 正在执行 {step_name.upper()}...")
     try:
-        # 使用 Popen 实时读取子进程输出
-        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
-
-        # 按行实时输出
-        output_lines = []
-        if proc.stdout is not None:
-            for line in proc.stdout:
-                print(line, end='')   # 直接输出到控制台
-                output_lines.append(line)
-
-        proc.wait()
-        if proc.returncode != 0:
-            print(f"❌ {script_name} 执行失败 (code={proc.returncode})")
-            sys.exit(proc.returncode)
-
-        print(f"✅ {script_name} 执行成功")
-        if output_lines:
-            print("输出摘要:\n", "".join(output_lines[:200]), "...")
-
+        step()
+    except SystemExit:
+        raise
     except Exception as e:
-        print(f"❌ {script_name} 执行异常: {str(e)}")
+        print(f"❌ {step_name} 执行异常: {str(e)}")
         sys.exit(1)
+    print(f"✅ {step_name} 执行成功")
+
+def run_stage(steps: list[tuple[str, Callable[[], None]]]) -> None:
+    """执行一个阶段；阶段内的多个步骤并行运行，全部完成后才进入下一阶段"""
+    if len(steps) == 1:
+        run_step(*steps[0])
+        return
+    with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+        futures = [executor.submit(run_step, step_name, step) for step_name, step in steps]
+        for future in futures:
+            future.result()
 
 def main():
     parser = argparse.ArgumentParser(description="通用协议关键词处理系统")
@@ -93,7 +73,6 @@ def main():
 
     # 创建默认 config
     config = create_default_config(store_dir)
-    config_file = keyword_dir / "keywords_config.json"
 
     # 检查必要文件
     required_files = [Path(config["paths"]["input_json"]), Path(config["paths"]["specify_keywords"])]
@@ -103,17 +82,30 @@ def main():
         print("\n".join(missing))
         sys.exit(1)
 
-    # 执行处理流程
-    processing_steps = [
-        ("keywords", False),
-        ("specify_keywords_update", True),
-        ("modal_keywords_update", True),
-        ("comparative_keywords_updates", True),
-        ("keywords_final", True)
-    ]
-
-    for step, needs_key in processing_steps:
-        run_subprocess(step, config_file, args.protocol, args.version, args.apikey if needs_key else None)
+    # 执行处理流程：各步骤在本进程内直接调用，避免每步重新启动解释器并导入依赖
+    from . import (
+        comparative_keywords_updates,
+        keywords,
+        keywords_final,
+        modal_keywords_update,
+        specify_keywords_update,
+    )
+
+    # 三个扩充步骤都只读取 keywords 的输出、各写各的结果文件，彼此无依赖，可并行执行；
+    # 它们共用一个按 max_workers 限定的线程池，总并发与单步运行时相同，避免触发限流
+    with ThreadPoolExecutor(max_workers=specify_keywords_update.this_workers) as llm_executor:
+        processing_stages: list[list[tuple[str, Callable[[], None]]]] = [
+            [("keywords", lambda: keywords.run(config))],
+            [
+                ("specify_keywords_update", lambda: specify_keywords_update.main(args.apikey, args.protocol, args.version, config, llm_executor)),
+                ("modal_keywords_update", lambda: modal_keywords_update.main(args.apikey, config, llm_executor)),
+                ("comparative_keywords_updates", lambda: comparative_keywords_updates.main(args.apikey, args.protocol, args.version, config, llm_executor)),
+            ],
+            [("keywords_final", lambda: keywords_final.main(args.apikey, config, args.protocol))],
+        ]
+
+        for stage in processing_stages:
+            run_stage(stage)
 
     print("\n🎉 处理完成！结果文件:")
     print(f" - 关键词列表: {config['paths']['keyword_list']}")
@@ -1,9 +1,26 @@
 import json
+import mmap
+import os
 import re
 from pathlib import Path
 from typing import Any, Dict, List, cast
 import argparse
 
+import orjson
+
+# 预编译正则，避免逐章节重复查找 re 模块缓存
+_TRAILING_COMMA_RE = re.compile(r',\s*}(?=,|\s*$)')
+_LINE_COMMENT_RE = re.compile(r'//.*?$', re.MULTILINE)
+_QUOTED_BYTES_RE = re.compile(rb'"([^"]*)"', re.DOTALL)
+
+
+def _safe_print(message: str) -> None:
+    """打印日志；仅当内容无法编码（如孤立代理字符）时才剔除不可编码字符后重试"""
+    try:
+        print(message)
+    except UnicodeEncodeError:
+        print(message.encode('utf-8', errors='ignore').decode('utf-8'))
+
 
 def extract_quoted_keywords(config: Dict) -> List[str]:
     """
@@ -22,34 +39,34 @@ def extract_quoted_keywords(config: Dict) -> List[str]:
         if not json_path.exists():
             raise FileNotFoundError(f"JSON关键词文件不存在: {json_path}")
 
-        with open(json_path, "r", encoding="utf-8") as f:
-            content = f.read().strip()
+        raw = json_path.read_bytes()
 
-        # JSON解析尝试
+        # JSON解析尝试（orjson 直接解析字节，仅在修复时才解码为文本）
         try:
-            data = json.loads(content)
-        except json.JSONDecodeError as e:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError as e:
             print(f"⚠️ JSON解析失败，尝试修复... (错误位置: {e.pos})")
-            content = re.sub(r',\s*}(?=,|\s*$)', '}', content)  # 修复多余逗号
-            content = re.sub(r'//.*?$', '', content, flags=re.MULTILINE)  # 移除注释
-            data = json.loads(content)
-
-        # 递归提取关键词
-        keywords = []
-
-        def _extract(obj):
-            if isinstance(obj, dict):
-                for k, v in obj.items():
-                    keywords.append(k)
-                    _extract(v)
-            elif isinstance(obj, list):
-                for item in obj:
-                    _extract(item)
-            elif isinstance(obj, str):
-                keywords.append(obj)
-
-        _extract(data)
-        return list(set(keywords))  # 去重
+            content = raw.decode("utf-8").strip()
+            content = _TRAILING_COMMA_RE.sub('}', content)  # 修复多余逗号
+            content = _LINE_COMMENT_RE.sub('', content)  # 移除注释
+            data = orjson.loads(content)
+
+        # 用显式栈遍历多级结构提取关键词，避免逐层递归调用
+        keywords: set[str] = set()
+        add = keywords.add
+        stack = [data]
+        while stack:
+            obj = stack.pop()
+            obj_type = type(obj)
+            if obj_type is dict:
+                keywords.update(obj)
+                stack.extend(obj.values())
+            elif obj_type is list:
+                stack.extend(obj)
+            elif obj_type is str:
+                add(obj)
+
+        return list(keywords)  # 集合插入时已去重
 
     except Exception as e:
         print(f"❌ JSON关键词提取失败: {str(e)}")
@@ -72,9 +89,23 @@ def extract_txt_keywords(config: Dict) -> List[str]:
         if not txt_path.exists():
             raise FileNotFoundError(f"文本关键词文件不存在: {txt_path}")
 
-        with open(txt_path, "r", encoding="utf-8") as f:
-            content = f.read()
-            return re.findall(r'"([^"]*)"', content, re.DOTALL)
+        # 直接在内存映射的字节上匹配，无需把整个文件解码为 str；
+        # UTF-8 多字节序列中不会出现 '"'，逐个解码匹配结果即可
+        with open(txt_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return []
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # dict.fromkeys 在 C 层去重并保留首次出现顺序，保证生成的提示词稳定
+                matches = dict.fromkeys(_QUOTED_BYTES_RE.findall(mm))
+
+        keywords = []
+        for match in matches:
+            keyword = match.decode("utf-8")
+            if "\r" in keyword:
+                # 与文本模式读取时的通用换行转换保持一致
+                keyword = keyword.replace("\r\n", "\n").replace("\r", "\n")
+            keywords.append(keyword)
+        return list(dict.fromkeys(keywords))
 
     except Exception as e:
         print(f"❌ 文本关键词提取失败: {str(e)}")
@@ -93,8 +124,8 @@ def reconstruct_paragraphs(config: Dict) -> None:
         input_path = config["paths"]["input_json"]
         output_path = config["paths"]["paragraph_output"]
 
-        with open(input_path, "r", encoding="utf-8") as f:
-            content = json.load(f)
+        with open(input_path, "rb") as f:
+            content = orjson.loads(f.read())
 
         results = {}
         for heading, data in content.items():
@@ -126,40 +157,37 @@ def reconstruct_paragraphs(config: Dict) -> None:
                 for item in sentences:
                     if isinstance(item, dict):
                         item_dict = cast(dict[str, Any], item)
-                        original = item_dict.get("Original", str(item_dict))
-                        adjusted = item_dict.get("Adjusted")
-                        paragraph_parts.append(str(original if adjusted == "No change" else item_dict.get("Adjusted", original)))
+                        # 缺少 Adjusted 与 "No change" 等价，均取原句；仅在缺少 Original 时才序列化整条记录
+                        adjusted = item_dict.get("Adjusted", "No change")
+                        if adjusted == "No change":
+                            text = item_dict["Original"] if "Original" in item_dict else str(item_dict)
+                        else:
+                            text = adjusted
+                        paragraph_parts.append(str(text))
                     else:
                         paragraph_parts.append(str(item))
                 paragraph = ' '.join(paragraph_parts)
-                results[heading] = re.sub(r'\s+', ' ', paragraph).strip()
+                # 按空白切分再以单个空格拼接，与 re.sub(r'\s+', ' ', ...).strip() 结果一致，但全程在 C 层完成
+                results[heading] = ' '.join(paragraph.split())
 
             except Exception as e:
-                print(f"章节处理失败: {heading} - {str(e)}".encode('utf-8', errors='ignore').decode('utf-8'))
+                _safe_print(f"章节处理失败: {heading} - {str(e)}")
                 results[heading] = ""
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(results, f, ensure_ascii=False, indent=2)
+        # orjson 的 OPT_INDENT_2 输出与 json.dump(indent=2, ensure_ascii=False) 逐字节一致，且在 C 层一次完成编码
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
 
-        print(f"已生成段落文件: {output_path}".encode('utf-8', errors='ignore').decode('utf-8'))
+        _safe_print(f"已生成段落文件: {output_path}")
 
     except Exception as e:
-        print(f"段落重组失败: {str(e)}".encode('utf-8', errors='ignore').decode('utf-8'))
+        _safe_print(f"段落重组失败: {str(e)}")
         raise
 
 
-def main():
+def run(config: Dict) -> None:
+    """合并关键词并重组段落（供 __main__ 进程内调用）"""
     try:
-        parser = argparse.ArgumentParser()
-        parser.add_argument("--protocol", help="协议名称")  # 新增，可选
-        parser.add_argument("--version", help="协议版本")   # 新增，可选
-        parser.add_argument("--apikey", help="API Key")    # 可选
-        parser.add_argument("--config", required=True, help="配置文件路径")
-        args = parser.parse_args()
-
-        with open(args.config, "r", encoding="utf-8") as f:
-            config = json.load(f)
-
         # 多源关键词合并
         combined_keywords = []
 
@@ -193,5 +221,26 @@ def main():
         print(f"未捕获错误: {str(e)}")
 
 
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--protocol", help="协议名称")  # 新增，可选
+    parser.add_argument("--version", help="协议版本")   # 新增，可选
+    parser.add_argument("--apikey", help="API Key")    # 可选
+    parser.add_argument("--config", required=True, help="配置文件路径")
+    args = parser.parse_args()
+
+    try:
+        with open(args.config, "r", encoding="utf-8") as f:
+            config = json.load(f)
+    except FileNotFoundError as e:
+        print(f"关键文件缺失: {str(e)}")
+        return
+    except json.JSONDecodeError as e:
+        print(f"JSON解析错误: {str(e)}")
+        return
+
+    run(config)
+
+
 if __name__ == "__main__":
     main()
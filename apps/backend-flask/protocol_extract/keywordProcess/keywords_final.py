@@ -1,8 +1,10 @@
 import json
 import os
 import re
+from itertools import chain
 from pathlib import Path
 from typing import Dict, List
+import orjson
 from openai import OpenAI
 import toml
 import argparse
@@ -29,13 +31,17 @@ RFC2119_CORE = {
     "RECOMMENDED", "NOT RECOMMENDED"
 }
 
+# 修复 LLM 响应 JSON 时使用的预编译正则
+_CONTROL_CHAR_RE = re.compile(r'[\x00-\x1f\x7f-\x9f]')
+_UNESCAPED_QUOTE_RE = re.compile(r'(?<!\\)"(?=\w)')
+
 # ========== 数据加载 ==========
 def load_processed_data(config: Dict, data_type: str) -> Dict:
     """加载中间结果数据"""
     data_path = config["paths"][f"{data_type}_output"]
     try:
-        with open(data_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(data_path, "rb") as f:
+            return orjson.loads(f.read())
     except Exception as e:
         print(f"[ERROR] {data_type} 数据加载失败: {str(e)}")
         raise
@@ -43,35 +49,36 @@ def load_processed_data(config: Dict, data_type: str) -> Dict:
 
 def extract_keywords(data: Dict) -> List[str]:
     """从处理结果中提取关键词（不过滤）"""
-    keywords: list[str] = []
+    keywords: set[str] = set()
 
     for section, content in data.items():
         try:
             if not content or content == "{}":
                 continue
 
-            if isinstance(content, str):
+            # 数据均来自 JSON 解析，只会是内置的 dict/list/str，按精确类型分派即可
+            if type(content) is str:
                 try:
                     content = json.loads(content)
                 except json.JSONDecodeError:
                     continue
 
-            if isinstance(content, dict):
-                for key, values in content.items():
-                    if isinstance(values, list):
-                        keywords.extend(str(value) for value in values)
-                    elif isinstance(values, dict):
-                        keywords.extend(values.keys())
-                        for v in values.values():
-                            if isinstance(v, list):
-                                keywords.extend(str(value) for value in v)
-                            elif isinstance(v, str):
-                                keywords.append(v)
+            if type(content) is dict:
+                for values in content.values():
+                    values_type = type(values)
+                    if values_type is list:
+                        keywords.update(map(str, values))
+                    elif values_type is dict:
+                        keywords.update(values.keys())
+                        keywords.update(map(str, chain.from_iterable(
+                            v for v in values.values() if type(v) is list
+                        )))
+                        keywords.update(v for v in values.values() if type(v) is str)
 
         except Exception as e:
             print(f"[WARNING] 章节处理异常 [{section[:15]}]: {str(e)}")
 
-    return list(set(keywords))
+    return list(keywords)
 
 
 # ========== LLM 调用 ==========
@@ -128,7 +135,7 @@ def classify_keywords_with_llm(keywords_by_type: Dict[str, List[str]], apikey: s
             
             # 尝试解析JSON
             try:
-                parsed_response = json.loads(response_content)
+                parsed_response = orjson.loads(response_content)
                 if isinstance(parsed_response, dict) and cat in parsed_response:
                     values = parsed_response[cat]
                     result[cat] = [str(value) for value in values] if isinstance(values, list) else []
@@ -143,10 +150,10 @@ def classify_keywords_with_llm(keywords_by_type: Dict[str, List[str]], apikey: s
                 # 尝试修复常见的JSON问题
                 try:
                     # 移除可能的控制字符
-                    cleaned_content = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', response_content)
+                    cleaned_content = _CONTROL_CHAR_RE.sub('', response_content)
                     # 尝试修复未转义的引号
-                    cleaned_content = re.sub(r'(?<!\\)"(?=\w)', '\\"', cleaned_content)
-                    parsed_response = json.loads(cleaned_content)
+                    cleaned_content = _UNESCAPED_QUOTE_RE.sub('\\"', cleaned_content)
+                    parsed_response = orjson.loads(cleaned_content)
                     if isinstance(parsed_response, dict) and cat in parsed_response:
                         values = parsed_response[cat]
                         result[cat] = [str(value) for value in values] if isinstance(values, list) else []
@@ -172,7 +179,7 @@ def main(apikey, config, protocol):
         for data_type in ["specify", "modal", "comparative"]:
             data = load_processed_data(config, data_type)
             extracted = extract_keywords(data)
-            all_keywords[data_type] = list(set(extracted))
+            all_keywords[data_type] = extracted
 
         # 用 LLM 过滤
         classified = classify_keywords_with_llm(all_keywords, apikey, this_url, this_model, protocol)
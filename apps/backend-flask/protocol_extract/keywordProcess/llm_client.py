@@ -0,0 +1,18 @@
+import threading
+
+from openai import OpenAI
+
+# 同一进程内的所有步骤和工作线程共用客户端，复用其底层连接池，避免每个章节重新握手
+_client_cache: dict[tuple[str, str], OpenAI] = {}
+_client_lock = threading.Lock()
+
+
+def get_client(apikey: str, base_url: str) -> OpenAI:
+    """按 API 密钥和服务地址返回共享的 OpenAI 客户端"""
+    key = (apikey, base_url)
+    with _client_lock:
+        client = _client_cache.get(key)
+        if client is None:
+            client = OpenAI(api_key=apikey, base_url=base_url)
+            _client_cache[key] = client
+        return client
@@ -1,13 +1,24 @@
 import json
 import argparse
 import os
+import sys
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from openai import OpenAI
+from typing import Optional
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import nullcontext
+import orjson
 from tqdm import tqdm
 import toml
 import re
 
+if __package__:
+    from .llm_client import get_client
+    from .result_stream import write_results_atomically
+else:  # 作为独立脚本直接运行
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from llm_client import get_client
+    from result_stream import write_results_atomically
+
 # 获取当前脚本所在目录
 script_dir = Path(__file__).parent.parent
 config_path = script_dir / "config.toml"
@@ -23,20 +34,19 @@ this_url = (
 )
 this_model = toml_config["llm"]["model1"]
 this_temperature = toml_config["llm"]["temperature"]
+# 从响应中截取 JSON 对象
+_JSON_BRACE_RE = re.compile(r"\{[\s\S]*\}")
+
 
 def process_item(item: tuple, apikey: str) -> tuple:
     """处理单个章节的线程安全函数"""
     heading, content = item
     clean_json_str = ""
-    client = OpenAI(
-        api_key=apikey,
-        base_url=this_url
-    )
 
     try:
         # 动态构建提示词模板
         prompt_template = PROMPT_TEMPLATE.format(content=content)
-        response = client.chat.completions.create(
+        response = get_client(apikey, this_url).chat.completions.create(
             model=this_model,
             messages=[
                 {"role": "user", "content": prompt_template}
@@ -46,12 +56,12 @@ def process_item(item: tuple, apikey: str) -> tuple:
         raw_content = response.choices[0].message.content
         if raw_content is None:
             raise ValueError("Empty modal keyword response")
-        match = re.search(r"\{[\s\S]*\}", raw_content)
+        match = _JSON_BRACE_RE.search(raw_content)
         if not match:
             return heading, {"warning": "JSON parsed but format unexpected", "data": raw_content}
         clean_json_str = match.group(0)
         # 验证并清理响应
-        result = json.loads(clean_json_str)
+        result = orjson.loads(clean_json_str)
         #print(result)
         if not all(isinstance(v, list) for v in result.values()):
              return heading, {"warning": "JSON parsed but format unexpected", "data": clean_json_str}
@@ -64,23 +74,24 @@ def process_item(item: tuple, apikey: str) -> tuple:
         return heading, {"warning": "JSON parsed but format unexpected", "data": clean_json_str}
 
 
-def main(apikey: str,config):
+def main(apikey: str, config, executor: Optional[Executor] = None):
     """主处理流程"""
     try:
         # 加载输入数据
         input_path = config["paths"]["paragraph_output"]
-        with open(input_path, "r", encoding="utf-8") as f:
-            protocol_chapter = json.load(f)
+        with open(input_path, "rb") as f:
+            protocol_chapter = orjson.loads(f.read())
+
+        output_path = config["paths"]["modal_output"]
 
         # 多线程处理
-        results = {}
-        with ThreadPoolExecutor(
-                max_workers=this_workers
-        ) as executor:
-            futures = {
-                executor.submit(process_item, item, apikey): item
+        # 由调用方传入共享线程池时与其他步骤共用并发上限，否则自建线程池
+        pool = nullcontext(executor) if executor is not None else ThreadPoolExecutor(max_workers=this_workers)
+        with pool as llm_pool:
+            futures = [
+                llm_pool.submit(process_item, item, apikey)
                 for item in protocol_chapter.items()
-            }
+            ]
 
             # 带进度条处理
             with tqdm(
@@ -89,16 +100,12 @@ def main(apikey: str,config):
                     unit="section",
                     bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]"
             ) as pbar:
-                for future in as_completed(futures):
-                    heading, result = future.result()
-                    results[heading] = result
+                def on_result(heading: str) -> None:
                     pbar.update(1)
                     pbar.set_postfix(sec=heading[:15])
 
-        # 保存结果
-        output_path = config["paths"]["modal_output"]
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(results, f, ensure_ascii=False, indent=2)
+                # 结果随完成顺序逐条写入临时文件，全部成功后再替换正式输出
+                write_results_atomically(output_path, futures, on_result)
 
         print(f"\n情态关键词扩展完成，结果保存至: {output_path}")
 
@@ -0,0 +1,35 @@
+import os
+from concurrent.futures import Future, as_completed
+from contextlib import suppress
+from typing import Any, Callable, Collection
+
+import orjson
+
+
+def write_results_atomically(
+    output_path: str,
+    futures: Collection["Future[tuple[str, Any]]"],
+    on_result: Callable[[str], None],
+) -> None:
+    """按完成顺序把各章节的 (heading, result) 流式写成 JSON 对象，全部成功后再替换正式输出
+
+    出错时取消尚未开始的任务并删除临时文件，不会留下半截结果
+    """
+    tmp_path = f"{output_path}.tmp"
+    try:
+        with open(tmp_path, "wb") as out:
+            out.write(b"{")
+            separator = b"\n"
+            for future in as_completed(futures):
+                heading, result = future.result()
+                out.write(separator + orjson.dumps(heading) + b": " + orjson.dumps(result))
+                separator = b",\n"
+                on_result(heading)
+            out.write(b"\n}\n")
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        with suppress(OSError):
+            os.unlink(tmp_path)
+        raise
@@ -1,13 +1,23 @@
 import json
 import argparse
 import os
+import sys
 from pathlib import Path
-from typing import Dict
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from openai import OpenAI
+from typing import Dict, Optional
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import nullcontext
+import orjson
 from tqdm import tqdm
 import toml
 
+if __package__:
+    from .llm_client import get_client
+    from .result_stream import write_results_atomically
+else:  # 作为独立脚本直接运行
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from llm_client import get_client
+    from result_stream import write_results_atomically
+
 # 获取当前脚本所在目录
 script_dir = Path(__file__).parent.parent
 config_path = script_dir / "config.toml"
@@ -24,19 +34,16 @@ this_url = (
 this_model = toml_config["llm"]["model1"]
 this_temperature = toml_config["llm"]["temperature"]
 
+
 def process_item(item: tuple, apikey: str, config: Dict, protocol: str, version: str) -> tuple:
     """处理单个章节的线程安全函数"""
     heading, content = item
-    client = OpenAI(
-        api_key=apikey,
-        base_url=this_url
-    )
 
     try:
         # 动态构建提示词
         prompt = PROMPT_TEMPLATE.format(protocol=protocol,version=version,content=content,keywords=config["compact_keywords"])
 
-        response = client.chat.completions.create(
+        response = get_client(apikey, this_url).chat.completions.create(
             model=this_model,
             messages=[
                 {"role": "user", "content": prompt}
@@ -48,7 +55,7 @@ def process_item(item: tuple, apikey: str, config: Dict, protocol: str, version:
         content = response.choices[0].message.content
         if content is None:
             raise ValueError("Empty specify keyword response")
-        result = json.loads(content)
+        result = orjson.loads(content)
         #print(result)
         if not isinstance(result, dict):
             raise ValueError("Invalid response format")
@@ -61,31 +68,32 @@ def process_item(item: tuple, apikey: str, config: Dict, protocol: str, version:
         return heading, {"error": str(e)}
 
 
-def main(apikey: str, protocol: str, version: str, config):
+def main(apikey: str, protocol: str, version: str, config, executor: Optional[Executor] = None):
     """主处理流程"""
     try:
         # 加载输入数据
         input_path = config["paths"]["paragraph_output"]
-        with open(input_path, "r", encoding="utf-8") as f:
-            protocol_chapter = json.load(f)
+        with open(input_path, "rb") as f:
+            protocol_chapter = orjson.loads(f.read())
 
         # 加载关键词列表
         keywords_path = config["paths"]["keyword_list"]
-        with open(keywords_path, "r", encoding="utf-8") as f:
-            keyword_list = json.load(f)
+        with open(keywords_path, "rb") as f:
+            keyword_list = orjson.loads(f.read())
 
         # 生成紧凑格式关键词列表（存入config供线程使用）
         config["compact_keywords"] = "[" + ", ".join(f'"{w}"' for w in keyword_list) + "]"
 
+        output_path = config["paths"]["specify_output"]
+
         # 多线程处理
-        results = {}
-        with ThreadPoolExecutor(
-                max_workers=this_workers
-        ) as executor:
-            futures = {
-                executor.submit(process_item, item, apikey, config, protocol, version): item
+        # 由调用方传入共享线程池时与其他步骤共用并发上限，否则自建线程池
+        pool = nullcontext(executor) if executor is not None else ThreadPoolExecutor(max_workers=this_workers)
+        with pool as llm_pool:
+            futures = [
+                llm_pool.submit(process_item, item, apikey, config, protocol, version)
                 for item in protocol_chapter.items()
-            }
+            ]
 
             # 进度条显示
             with tqdm(
@@ -94,16 +102,12 @@ def main(apikey: str, protocol: str, version: str, config):
                     unit="section",
                     dynamic_ncols=True
             ) as pbar:
-                for future in as_completed(futures):
-                    heading, result = future.result()
-                    results[heading] = result
+                def on_result(heading: str) -> None:
                     pbar.update(1)
                     pbar.set_postfix_str(f"当前章节: {heading[:15]}...")
 
-        # 保存结果
-        output_path = config["paths"]["specify_output"]
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(results, f, ensure_ascii=False, indent=2)
+                # 结果随完成顺序逐条写入临时文件，全部成功后再替换正式输出
+                write_results_atomically(output_path, futures, on_result)
 
         print(f"\n规范关键词扩展完成，结果保存至: {output_path}")
 
@@ -10,9 +10,9 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import toml
 
-try:
+if __package__:
     from .output_format import build_legacy_rules_payload
-except ImportError:  # Direct script execution used by ruleProcess/__main__.py.
+else:  # Direct script execution used by ruleProcess/__main__.py.
     sys.path.insert(0, str(Path(__file__).resolve().parent))
     from output_format import build_legacy_rules_payload
 
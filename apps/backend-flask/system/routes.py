@@ -111,7 +111,7 @@ def dept_list():
     _, error = _ensure_authenticated()
     if error:
         return error
-    return success_response(deepcopy(DEPARTMENT_DATA))
+    return success_response(DEPARTMENT_DATA)
 
 
 @bp.post("/dept")
@@ -146,7 +146,7 @@ def menu_list():
     _, error = _ensure_authenticated()
     if error:
         return error
-    return success_response(deepcopy(MENU_LIST))
+    return success_response(MENU_LIST)
 
 
 @bp.get("/menu/path-exists")
@@ -230,9 +230,8 @@ def role_list():
     end_time = query.get("endTime")
     status = query.get("status")
 
-    working = deepcopy(ROLE_DATA)
     working = _filter_roles(
-        working,
+        ROLE_DATA,
         name=name,
         role_id=role_id,
         remark=remark,
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
 from datetime import datetime
 from functools import cmp_to_key
 from typing import Any, Dict, List, Tuple
@@ -102,7 +101,7 @@ def table_list():
     sort_by = request.args.get("sortBy")
     sort_order = request.args.get("sortOrder")
 
-    working = deepcopy(TABLE_DATA)
+    working = list(TABLE_DATA)
     if working and sort_by and sort_by in working[0]:
         reverse = sort_order == "desc"
 
@@ -919,3 +919,25 @@ def test_aflnet_output_defaults_to_protocolguard_runtime_tree(
 
     assert expected_output_root.exists()
     assert f"-v {expected_output_root}:/out/fuzz-output" in command
+
+
+def test_is_container_running_reuses_recent_positive_probe(monkeypatch) -> None:
+    fuzz_job_routes._container_running_checked_at.clear()
+    commands: list[str] = []
+
+    def fake_run(command, *args, **kwargs):
+        commands.append(command)
+        return SimpleNamespace(returncode=0, stdout="abc123\n", stderr="")
+
+    monkeypatch.setattr(fuzz_job_routes.subprocess, "run", fake_run)
+
+    assert fuzz_job_routes._is_container_running("abc123")
+    assert fuzz_job_routes._is_container_running("abc123")
+    assert len(commands) == 1
+
+    monkeypatch.setattr(
+        fuzz_job_routes, "CONTAINER_RUNNING_CACHE_TTL_SECONDS", 0.0
+    )
+    assert fuzz_job_routes._is_container_running("abc123")
+    assert len(commands) == 2
+    fuzz_job_routes._container_running_checked_at.clear()
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import json
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+
+from flask import Flask, jsonify
+from flask.json.provider import DefaultJSONProvider
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from utils.json_provider import OrjsonProvider
+
+
+@dataclass
+class _Point:
+    x: int
+    y: int
+
+
+def _payload() -> dict:
+    return {
+        "zeta": 1,
+        "alpha": {"when": datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)},
+        "price": Decimal("1.50"),
+        "point": _Point(1, 2),
+        "message": "协议",
+    }
+
+
+def _render(provider_class: type, *, debug: bool = False) -> bytes:
+    app = Flask(__name__)
+    app.debug = debug
+    app.json = provider_class(app)
+    with app.app_context():
+        return jsonify(_payload()).get_data()
+
+
+def test_orjson_provider_matches_default_provider_output() -> None:
+    for debug in (False, True):
+        expected = json.loads(_render(DefaultJSONProvider, debug=debug))
+        rendered = _render(OrjsonProvider, debug=debug)
+        assert json.loads(rendered) == expected
+        assert rendered.endswith(b"\n")
+    assert "协议".encode("utf-8") in _render(OrjsonProvider)
+
+
+def test_orjson_provider_falls_back_for_wide_integers() -> None:
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    with app.app_context():
+        body = jsonify({"value": 2**70}).get_data()
+    assert json.loads(body) == {"value": 2**70}
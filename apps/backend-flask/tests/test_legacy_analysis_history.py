@@ -5,6 +5,8 @@ import sqlite3
 import sys
 from pathlib import Path
 
+import pytest
+
 BACKEND_ROOT = Path(__file__).resolve().parents[1]
 if str(BACKEND_ROOT) not in sys.path:
     sys.path.insert(0, str(BACKEND_ROOT))
@@ -110,3 +112,39 @@ def test_list_available_implementations_matches_sqlite_database_names(tmp_path:
     (db_dir / "notes.txt").touch()
 
     assert set(list_available_implementations(base_dir=tmp_path)) == {"sol", "mosquitto"}
+
+
+def test_read_analysis_history_reparses_only_when_file_changes(tmp_path: Path) -> None:
+    history_file = tmp_path / "query_history.json"
+    history_file.write_text(json.dumps([{"id": "1"}]), encoding="utf-8")
+
+    first = read_analysis_history(base_dir=tmp_path)
+    first.append({"id": "mutated"})
+    assert read_analysis_history(base_dir=tmp_path) == [{"id": "1"}]
+
+    history_file.write_text(json.dumps([{"id": "2"}, {"id": "1"}]), encoding="utf-8")
+    assert read_analysis_history(base_dir=tmp_path) == [{"id": "2"}, {"id": "1"}]
+
+
+def test_read_detection_results_reloads_after_database_changes(tmp_path: Path) -> None:
+    db_path = tmp_path / "databases" / "sqlite_sol.db"
+    _create_rule_database(db_path)
+
+    assert len(read_detection_results("sol", base_dir=tmp_path)) == 3
+
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "INSERT INTO rule_code_snippet (rule_desc, code_snippet, llm_response) "
+            "VALUES ('rule four', 'line four', NULL)"
+        )
+
+    items = read_detection_results("sol", base_dir=tmp_path)
+    assert [item["rule_desc"] for item in items][-1] == "rule four"
+
+
+def test_missing_history_and_database_files(tmp_path: Path) -> None:
+    assert read_analysis_history(base_dir=tmp_path) == []
+
+    with pytest.raises(FileNotFoundError):
+        read_detection_results("missing", base_dir=tmp_path)
+    assert not (tmp_path / "databases" / "sqlite_missing.db").exists()
@@ -47,6 +47,9 @@ def test_violation_history_timestamp_payload_round_trip(monkeypatch, tmp_path: P
     saved = json.loads(state._violation_history_timestamp_store_path().read_text(encoding="utf-8"))
     assert saved == payload
     assert state._load_violation_history_timestamps() == payload
+    assert [path.name for path in (tmp_path / "state").iterdir()] == [
+        "violation_history_timestamps.json"
+    ]
 
 
 def test_violation_history_timestamp_loader_recovers_from_invalid_json(
@@ -63,3 +66,26 @@ def test_violation_history_timestamp_loader_recovers_from_invalid_json(
         "deleted": {},
         "rows": {},
     }
+
+
+def test_violation_history_timestamp_loader_returns_independent_copies(
+    monkeypatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.setenv("PROTOCOLGUARD_STATE_DIR", str(tmp_path / "state"))
+    state._save_violation_history_timestamps(
+        {"databases": {}, "deleted": {}, "rows": {"row": "seen"}}
+    )
+
+    first = state._load_violation_history_timestamps()
+    second = state._load_violation_history_timestamps()
+    assert second == first
+    assert second is not first
+    assert second["rows"] is not first["rows"]
+
+    first["rows"]["other"] = "later"
+    assert "other" not in state._load_violation_history_timestamps()["rows"]
+    state._save_violation_history_timestamps(first)
+    reloaded = state._load_violation_history_timestamps()
+    assert reloaded is not first
+    assert reloaded["rows"] == {"row": "seen", "other": "later"}
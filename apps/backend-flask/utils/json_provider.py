@@ -0,0 +1,65 @@
+"""orjson-backed JSON provider for the Flask app."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+_BASE_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Serialize ``jsonify`` responses and parse request bodies with orjson.
+
+    Dates and dataclasses are passed through to :attr:`default` so they
+    serialize exactly as with :class:`DefaultJSONProvider`. Anything orjson
+    rejects (e.g. integers wider than 64 bits) falls back to the stdlib
+    provider. Unlike the stdlib provider, non-ASCII text is emitted as UTF-8
+    rather than ``\\u`` escapes.
+    """
+
+    def _options(self, *, indent: bool) -> int:
+        options = _BASE_OPTIONS
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs.keys() - {"indent", "separators"}:
+            return super().dumps(obj, **kwargs)
+        try:
+            payload = orjson.dumps(
+                obj,
+                default=self.default,
+                option=self._options(indent=bool(kwargs.get("indent"))),
+            )
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+        return payload.decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        try:
+            body = orjson.dumps(
+                obj,
+                default=self.default,
+                option=self._options(indent=indent) | orjson.OPT_APPEND_NEWLINE,
+            )
+        except TypeError:
+            return super().response(*args, **kwargs)
+        return self._app.response_class(body, mimetype=self.mimetype)
@@ -5,7 +5,7 @@ from __future__ import annotations
 import time
 from typing import Any, Dict, Optional, Tuple
 
-from flask import Response, make_response
+from flask import Response, jsonify
 
 
 def success_response(data: Any, message: str = "ok") -> Dict[str, Any]:
@@ -56,13 +56,13 @@ def paginate(
 def unauthorized() -> Tuple[Response, int]:
     """Flask-compatible unauthorized response."""
     payload = error_response("Unauthorized Exception", "Unauthorized Exception")
-    return make_response(payload), 401
+    return jsonify(payload), 401
 
 
 def forbidden(message: str = "Forbidden Exception") -> Tuple[Response, int]:
     """Flask-compatible forbidden response."""
     payload = error_response(message, message)
-    return make_response(payload), 403
+    return jsonify(payload), 403
 
 
 def sleep(ms: int) -> None: